@@ -45,6 +45,7 @@ class Settings:
             # Data configurations
             'data': {
                 'cards_file': 'data/databaseMTG.csv',
+                'collection_file': 'data/collection.pkl',
                 'decks_directory': 'data/decks',
                 'cache_directory': 'data/cache',
                 'images_directory': 'data/images',
@@ -192,6 +193,10 @@ class Settings:
     def cards_file(self) -> str:
         return self.get('data.cards_file', 'data/databaseMTG.csv')
     
+    @property
+    def collection_file(self) -> str:
+        return self.get('data.collection_file', 'data/collection.pkl')
+    
     @property
     def decks_directory(self) -> str:
         return self.get('data.decks_directory', 'data/decks')
@@ -8,6 +8,7 @@ from ..config.settings import get_settings
 from ..services.card_service import CardService
 from ..services.deck_service import DeckService
 from ..services.image_service import ImageService
+from ..services import scryfall_service
 from ..services.scryfall_service import ScryfallService
 from ..models.deck import Deck
 from ..models.card import Card
@@ -68,8 +69,8 @@ class AppController:
                 cache_dir=self.settings.images_directory
             )
             
-            # Scryfall service
-            self.scryfall_service = ScryfallService()
+            # Scryfall service, shared so every view uses one session, cache and rate limit
+            self.scryfall_service = scryfall_service.get_service()
             
             # Deck service
             self.deck_service = DeckService(
@@ -166,18 +167,17 @@ class AppController:
             results = self.card_service.search_cards(query)
             
             if filters:
-                # Apply additional filters
-                if 'color' in filters:
-                    results = self.card_service.filter_by_color(results, filters['color'])
-                
-                if 'type' in filters:
-                    results = self.card_service.filter_by_type(results, filters['type'])
-                
-                if 'rarity' in filters:
-                    results = self.card_service.filter_by_rarity(results, filters['rarity'])
-                
-                if 'set' in filters:
-                    results = self.card_service.filter_by_set(results, filters['set'])
+                # Apply additional filters in a single pass
+                colors = filters.get('color')
+                if isinstance(colors, str):
+                    colors = [colors]
+                results = self.card_service.query(
+                    colors=colors,
+                    card_type=filters.get('type'),
+                    rarity=filters.get('rarity'),
+                    set_code=filters.get('set'),
+                    cards=results
+                )
             
             return results
             
@@ -185,6 +185,15 @@ class AppController:
             self.logger.error(f"Error searching cards: {e}")
             return []
     
+    def get_cards_by_names(self, names: List[str]) -> Dict[str, Card]:
+        """Resolves several exact card names (case insensitive) in one pass, omitting the unknown ones"""
+        try:
+            found = self.card_service.find_cards_by_names(names)
+            return {name: card for name, card in found.items() if card is not None}
+        except Exception as e:
+            self.logger.error(f"Error getting cards by name: {e}")
+            return {}
+    
     def get_card_image(self, card: Card, size: str = 'normal') -> Optional[str]:
         """Gets the image of a card"""
         try:
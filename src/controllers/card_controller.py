@@ -55,8 +55,7 @@ class CardController:
     def get_cards_by_color(self, colors: List[str]) -> List[Card]:
         """Gets cards by colors"""
         try:
-            all_cards = self.card_service.load_cards()
-            return self.card_service.filter_by_color(all_cards, colors)
+            return self.card_service.get_cards_by_color(colors)
         except Exception as e:
             self.logger.error(f"Error filtering by colors: {e}")
             return []
@@ -64,8 +63,7 @@ class CardController:
     def get_cards_by_type(self, card_type: str) -> List[Card]:
         """Gets cards by type"""
         try:
-            all_cards = self.card_service.load_cards()
-            return self.card_service.filter_by_type(all_cards, card_type)
+            return self.card_service.get_cards_by_type(card_type)
         except Exception as e:
             self.logger.error(f"Error filtering by type: {e}")
             return []
@@ -73,8 +71,7 @@ class CardController:
     def get_cards_by_rarity(self, rarity: str) -> List[Card]:
         """Gets cards by rarity"""
         try:
-            all_cards = self.card_service.load_cards()
-            return self.card_service.filter_by_rarity(all_cards, rarity)
+            return self.card_service.get_cards_by_rarity(rarity)
         except Exception as e:
             self.logger.error(f"Error filtering by rarity: {e}")
             return []
@@ -82,8 +79,7 @@ class CardController:
     def get_cards_by_set(self, set_code: str) -> List[Card]:
         """Gets cards by set"""
         try:
-            all_cards = self.card_service.load_cards()
-            return self.card_service.filter_by_set(all_cards, set_code)
+            return self.card_service.get_cards_by_set(set_code)
         except Exception as e:
             self.logger.error(f"Error filtering by set: {e}")
             return []
@@ -91,24 +87,18 @@ class CardController:
     def advanced_search(self, filters: Dict[str, Any]) -> List[Card]:
         """Advanced search with multiple filters"""
         try:
-            # Start with all cards or with a text search
+            # Text search narrows the candidates, indexed filters are applied in one pass
+            candidates = None
             if 'query' in filters and filters['query']:
-                results = self.search_cards(filters['query'], limit=0)
-            else:
-                results = self.card_service.load_cards()
-            
-            # Apply filters
-            if 'colors' in filters and filters['colors']:
-                results = self.card_service.filter_by_color(results, filters['colors'])
-            
-            if 'type' in filters and filters['type']:
-                results = self.card_service.filter_by_type(results, filters['type'])
-            
-            if 'rarity' in filters and filters['rarity']:
-                results = self.card_service.filter_by_rarity(results, filters['rarity'])
-            
-            if 'set' in filters and filters['set']:
-                results = self.card_service.filter_by_set(results, filters['set'])
+                candidates = self.search_cards(filters['query'], limit=0)
+            
+            results = self.card_service.query(
+                colors=filters.get('colors') or None,
+                card_type=filters.get('type') or None,
+                rarity=filters.get('rarity') or None,
+                set_code=filters.get('set') or None,
+                cards=candidates
+            )
             
             # Additional filters
             if 'min_cmc' in filters:
@@ -120,7 +110,7 @@ class CardController:
                           if card.get_simplified_cmc() <= filters['max_cmc']]
             
             if 'creatures_only' in filters and filters['creatures_only']:
-                results = [card for card in results if card.is_creature()]
+                results = [card for card in results if card.is_creature]
             
             # Sort results
             sort_by = filters.get('sort_by', 'name')
@@ -287,7 +277,7 @@ class CardController:
                 return False
             
             old_quantity = card.quantity
-            card.quantity = max(0, new_quantity)  # Don't allow negative quantities
+            self.card_service.set_card_quantity(card, max(0, new_quantity))  # Don't allow negative quantities
             
             # Here persistence of changes could be implemented
             # For now we only update in memory
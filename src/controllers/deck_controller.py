@@ -103,6 +103,15 @@ class DeckController:
             self.logger.error(f"Error adding card to deck: {e}")
             return False
     
+    def get_card_suggestions(self, prefix: str, limit: int = 10) -> List[str]:
+        """Gets card names starting with prefix, for autocomplete while building"""
+        try:
+            cards = self.card_service.find_cards_by_prefix(prefix, limit)
+            return [card.card_name for card in cards]
+        except Exception as e:
+            self.logger.error(f"Error getting card suggestions: {e}")
+            return []
+    
     def remove_card_from_deck(self, card_name: str, quantity: Optional[int] = None) -> bool:
         """Removes a card from the current deck"""
         if not self.current_deck:
@@ -1,10 +1,31 @@
 """Data model for MTG cards"""
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, fields
 from typing import Optional, List
 
+# Generic mana amounts or colored mana symbols in a mana cost
+_MANA_SYMBOL = re.compile(r'(\d+)|[WUBRG]')
 
-@dataclass
+# Color codes inside a color list stored as text, e.g. "['R', 'G']" or "R,G"
+_COLOR_CODE = re.compile(r'[WUBRG]')
+
+
+def _with_slots(cls, extra_slots=()):
+    """Recreates a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        # Defaults live in the generated __init__, the class attributes would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names + tuple(extra_slots)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@dataclass(eq=False)
 class Card:
     """Represents a Magic: The Gathering card"""
     
@@ -30,26 +51,57 @@ class Card:
             self.colors = []
         if self.color_identity is None:
             self.color_identity = []
+        
+        # Color lists read as text are parsed once, so every consumer sees a list of codes
+        if isinstance(self.colors, str):
+            self.colors = _COLOR_CODE.findall(self.colors)
+        if isinstance(self.color_identity, str):
+            self.color_identity = _COLOR_CODE.findall(self.color_identity)
+        
+        # Intern low-cardinality strings so equal values share one object
+        if isinstance(self.colors, (list, tuple)):
+            self.colors = [sys.intern(color) for color in self.colors]
+        if isinstance(self.color_identity, (list, tuple)):
+            self.color_identity = [sys.intern(color) for color in self.color_identity]
+        if self.rarity:
+            self.rarity = sys.intern(self.rarity)
+        if self.set_code:
+            self.set_code = sys.intern(self.set_code)
+        
+        # Precomputed once instead of rescanning type_line on every access
+        self.is_creature = bool(self.type_line and 'Creature' in self.type_line)
+        self.main_type_tokens = (
+            tuple(sys.intern(token) for token in self.type_line.split(' — ')[0].split(' '))
+            if self.type_line else ()
+        )
+    
+    @property
+    def _identity_key(self) -> str:
+        """Key that identifies the card: Scryfall UUID, or name as fallback"""
+        return self.scryfall_uuid or self.card_name
+    
+    def __eq__(self, other) -> bool:
+        """Two cards are equal if they share UUID (or name when the UUID is missing)"""
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self._identity_key == other._identity_key
+    
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__ so cards can be used in sets and dicts"""
+        return hash(self._identity_key)
     
     @property
     def display_name(self) -> str:
         """Name to display in the interface"""
         return self.english_card_name or self.card_name
     
-    @property
-    def is_creature(self) -> bool:
-        """Checks if the card is a creature"""
-        return self.type_line and 'Creature' in self.type_line
-    
     @property
     def converted_mana_cost(self) -> int:
         """Calculates the converted mana cost (simplified)"""
         if not self.mana_cost:
             return 0
         # Simplified implementation - in a real project it would be more complex
-        import re
-        numbers = re.findall(r'\d+', self.mana_cost)
-        return sum(int(n) for n in numbers) + len(re.findall(r'[WUBRG]', self.mana_cost))
+        return sum(int(number) if number else 1 for number in _MANA_SYMBOL.findall(self.mana_cost))
     
     def to_dict(self) -> dict:
         """Converts the card to dictionary for serialization"""
@@ -90,4 +142,27 @@ class Card:
             set_code=data.get('set_code'),
             collector_number=data.get('collector_number'),
             image_url=data.get('image_url')
-        )
\ No newline at end of file
+        )
+    
+    @classmethod
+    def from_scryfall_brief(cls, data: dict) -> 'Card':
+        """Creates a card from a Scryfall card object, keeping only the fields the interface shows"""
+        # Double-faced cards keep cost and images on the faces
+        front_face = (data.get('card_faces') or [{}])[0]
+        image_uris = data.get('image_uris') or front_face.get('image_uris') or {}
+        return cls(
+            card_name=data.get('name', ''),
+            scryfall_uuid=data.get('id'),
+            mana_cost=data.get('mana_cost') or front_face.get('mana_cost'),
+            type_line=data.get('type_line'),
+            colors=data.get('colors', front_face.get('colors', [])),
+            color_identity=data.get('color_identity', []),
+            rarity=data.get('rarity'),
+            set_code=data.get('set'),
+            collector_number=data.get('collector_number'),
+            image_url=image_uris.get('normal')
+        )
+
+
+# Slots keep large card lists compact; derived attributes from __post_init__ need their own slots
+Card = _with_slots(Card, extra_slots=('is_creature', 'main_type_tokens'))
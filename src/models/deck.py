@@ -1,11 +1,14 @@
 """Data model for MTG decks"""
 
+import sys
+from operator import attrgetter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from collections import Counter
+from typing import List, Dict, Optional, Tuple
 
 from .card import Card
 
+_quantity = attrgetter('quantity')
+
 
 @dataclass
 class Deck:
@@ -16,6 +19,11 @@ class Deck:
     format: Optional[str] = None
     description: Optional[str] = None
     
+    def __post_init__(self):
+        """Data normalization after initialization"""
+        if self.format:
+            self.format = sys.intern(self.format)
+    
     def add_card(self, card: Card, quantity: int = 1) -> None:
         """Adds a card to the deck"""
         existing_card = self.find_card(card.card_name)
@@ -46,7 +54,7 @@ class Deck:
     @property
     def total_cards(self) -> int:
         """Total number of cards in the deck"""
-        return sum(card.quantity for card in self.cards)
+        return sum(map(_quantity, self.cards))
     
     @property
     def unique_cards(self) -> int:
@@ -56,31 +64,51 @@ class Deck:
     @property
     def color_distribution(self) -> Dict[str, int]:
         """Color distribution in the deck"""
-        color_count = Counter()
+        color_count = {}
+        get = color_count.get
         for card in self.cards:
+            quantity = card.quantity
             for color in card.color_identity:
-                color_count[color] += card.quantity
-        return dict(color_count)
+                color_count[color] = get(color, 0) + quantity
+        return color_count
     
     @property
     def mana_curve(self) -> Dict[int, int]:
         """Mana curve of the deck"""
-        curve = Counter()
+        curve = {}
+        get = curve.get
         for card in self.cards:
             cmc = card.converted_mana_cost
-            curve[cmc] += card.quantity
-        return dict(curve)
+            curve[cmc] = get(cmc, 0) + card.quantity
+        return curve
     
     @property
     def type_distribution(self) -> Dict[str, int]:
         """Card type distribution"""
-        type_count = Counter()
+        type_count = {}
+        get = type_count.get
         for card in self.cards:
             if card.type_line:
                 # Simplified - extract main type
-                main_type = card.type_line.split(' — ')[0].split(' ')[-1]
-                type_count[main_type] += card.quantity
-        return dict(type_count)
+                main_type = card.main_type_tokens[-1]
+                type_count[main_type] = get(main_type, 0) + card.quantity
+        return type_count
+    
+    def distributions(self) -> Tuple[Dict[str, int], Dict[int, int], Dict[str, int]]:
+        """Color distribution, mana curve and type distribution computed in a single pass"""
+        color_count = {}
+        curve = {}
+        type_count = {}
+        for card in self.cards:
+            quantity = card.quantity
+            for color in card.color_identity:
+                color_count[color] = color_count.get(color, 0) + quantity
+            cmc = card.converted_mana_cost
+            curve[cmc] = curve.get(cmc, 0) + quantity
+            if card.type_line:
+                main_type = card.main_type_tokens[-1]
+                type_count[main_type] = type_count.get(main_type, 0) + quantity
+        return color_count, curve, type_count
     
     def get_cards_by_type(self, card_type: str) -> List[Card]:
         """Gets all cards of a specific type"""
@@ -1,11 +1,32 @@
 """Service for MTG card management"""
 
 import csv
-from typing import List, Optional, Dict
+import os
+import pickle
+import sys
+import threading
+from bisect import bisect_left
+from dataclasses import fields
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from ..models.card import Card
 
+_CARD_FIELDS = tuple(field.name for field in fields(Card))
+_NAME_INDEX = _CARD_FIELDS.index('card_name')
+_QUANTITY_INDEX = _CARD_FIELDS.index('quantity')
+_quantity = attrgetter('quantity')
+
+# Supertypes left out of the available card types
+_TYPE_SUPERTYPES = frozenset(('Legendary', 'Basic', 'Snow'))
+
+# Upper bound for memoized raw-name lookups before the memo is reset
+_LOOKUP_CACHE_SIZE = 4096
+
+# Bump when the parsing rules change so stale row caches are discarded
+_CACHE_VERSION = 1
+
 
 class CardService:
     """Service for MTG card operations"""
@@ -14,156 +35,427 @@ class CardService:
         self.data_path = Path(data_path)
         self._cards_cache: Optional[List[Card]] = None
         self._cards_by_name: Optional[Dict[str, Card]] = None
+        self._lookup_cache: Dict[str, Optional[Card]] = {}
+        # Views may load from a worker thread; loading, indexing and name misses hold this lock
+        self._load_lock = threading.RLock()
+        self._file_signature: Optional[tuple] = None
+        self._by_rarity: Dict[str, List[Card]] = {}
+        self._by_set: Dict[str, List[Card]] = {}
+        # Positions in the card list, so multi-key lookups can be merged back in collection order
+        self._by_color: Dict[str, List[int]] = {}
+        self._by_type_token: Dict[str, List[int]] = {}
+        self._sets: List[str] = []
+        self._types: List[str] = []
+        self._stats: Optional[Dict[str, Any]] = None
+        self._lower_names: List[str] = []
+        self._lower_english_names: List[str] = []
+        self._trigrams: Optional[Dict[str, List[int]]] = None
+        self._sorted_names: Optional[List[Tuple[str, int]]] = None
+    
+    @property
+    def cards(self) -> List[Card]:
+        """All collection cards, loaded on first access"""
+        if self._cards_cache is not None:
+            return self._cards_cache
+        return self.load_cards()
     
     def load_cards(self, force_reload: bool = False) -> List[Card]:
         """Loads all cards from the CSV file"""
-        if self._cards_cache is None or force_reload:
-            self._cards_cache = self._load_cards_from_file()
-            self._build_name_index()
-        return self._cards_cache
+        with self._load_lock:
+            if self._cards_cache is None or force_reload:
+                self._cards_cache = self._load_cards_from_file()
+                self._build_name_index()
+            return self._cards_cache
     
     def _load_cards_from_file(self) -> List[Card]:
-        """Loads cards from the CSV file"""
-        cards = []
-        
+        """Loads cards from the parsed-rows cache, or from the CSV file if stale"""
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
         
+        stat = self.data_path.stat()
+        self._file_signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (_CACHE_VERSION, _CARD_FIELDS, stat.st_mtime_ns, stat.st_size)
+        
+        rows = self._read_rows_cache(cache_key)
+        if rows is None:
+            rows = self._read_rows_from_csv()
+            self._write_rows_cache(cache_key, rows)
+        
+        cards = []
+        for values in rows:
+            try:
+                cards.append(Card(*values))
+            except Exception as e:
+                print(f"Error processing card: {values[_NAME_INDEX] or 'Unknown'} - {e}")
+                continue
+        
+        return cards
+    
+    def _read_rows_from_csv(self) -> List[list]:
+        """Parses the CSV file into lists of Card field values"""
+        rows = []
+        
         try:
-            with open(self.data_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file, delimiter=';')
+            with open(self.data_path, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file, delimiter=';')
+                header = next(reader, [])
+                width = len(header)
+                
+                # Map each Card field to its CSV column once so rows are read
+                # positionally instead of going through a dict per row
+                columns = [header.index(name) if name in header else None for name in _CARD_FIELDS]
+                
                 for row in reader:
+                    if len(row) < width:
+                        row += [None] * (width - len(row))
+                    values = [row[index] if index is not None else None for index in columns]
                     try:
-                        card = Card.from_dict(row)
-                        cards.append(card)
+                        values[_QUANTITY_INDEX] = int(values[_QUANTITY_INDEX] or 0)
+                        rows.append(values)
                     except Exception as e:
-                        print(f"Error processing card: {row.get('card_name', 'Unknown')} - {e}")
+                        print(f"Error processing card: {values[_NAME_INDEX] or 'Unknown'} - {e}")
                         continue
         except Exception as e:
             raise Exception(f"Error reading cards file: {e}")
         
-        return cards
+        return rows
+    
+    @property
+    def _rows_cache_path(self) -> Path:
+        """Path of the binary cache stored next to the CSV file"""
+        return self.data_path.with_suffix('.pkl')
+    
+    def _read_rows_cache(self, cache_key: tuple) -> Optional[List[list]]:
+        """Reads the parsed rows if the cache matches the current CSV file"""
+        try:
+            with open(self._rows_cache_path, 'rb') as file:
+                stored_key, rows = pickle.load(file)
+            if stored_key == cache_key:
+                return rows
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable cards cache: {e}")
+        return None
+    
+    def _write_rows_cache(self, cache_key: tuple, rows: List[list]) -> None:
+        """Stores the parsed rows so the next start skips CSV parsing"""
+        cache_path = self._rows_cache_path
+        temp_path = cache_path.with_suffix('.pkl.tmp')
+        try:
+            with open(temp_path, 'wb') as file:
+                pickle.dump((cache_key, rows), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Could not write cards cache: {e}")
     
     def _build_name_index(self) -> None:
-        """Builds a card index by name for fast searches"""
+        """Builds the name index and all precomputed aggregates in a single pass"""
         if self._cards_cache is None:
             return
         
         self._cards_by_name = {}
-        for card in self._cards_cache:
+        self._lookup_cache = {}
+        self._by_rarity = {}
+        self._by_set = {}
+        self._by_color = {}
+        self._by_type_token = {}
+        self._lower_names = []
+        self._lower_english_names = []
+        self._trigrams = None
+        self._sorted_names = None
+        sets = set()
+        type_token_tuples = set()
+        quantities = []
+        rarity_groups = {}
+        type_groups = {}
+        
+        for position, card in enumerate(self._cards_cache):
+            # Lowercase names kept parallel to the cards for substring search
+            name_lower = sys.intern(card.card_name.lower()) if card.card_name else ''
+            english_lower = sys.intern(card.english_card_name.lower()) if card.english_card_name else ''
+            self._lower_names.append(name_lower)
+            self._lower_english_names.append(english_lower)
+            
             # Index by main name
-            if card.card_name:
-                self._cards_by_name[card.card_name.lower()] = card
+            if name_lower:
+                self._cards_by_name[name_lower] = card
             
             # Index by English name if it exists
-            if card.english_card_name:
-                self._cards_by_name[card.english_card_name.lower()] = card
+            if english_lower:
+                self._cards_by_name[english_lower] = card
+            
+            quantities.append(card.quantity)
+            
+            for color in card.color_identity:
+                self._by_color.setdefault(color, []).append(position)
+            
+            if card.rarity:
+                rarity_groups.setdefault(card.rarity, []).append(card)
+            
+            if card.set_code:
+                self._by_set.setdefault(card.set_code.lower(), []).append(card)
+                sets.add(card.set_code)
+            
+            if card.type_line:
+                # Only a few hundred distinct token tuples exist, expanded after the loop
+                main_types = card.main_type_tokens
+                type_token_tuples.add(main_types)
+                type_groups.setdefault(main_types[-1], []).append(card)
+                
+                for token in set(card.type_line.lower().split()):
+                    self._by_type_token.setdefault(token, []).append(position)
+        
+        # Distributions are summed per group at C speed instead of a dict update per card
+        colors = {color: sum(map(quantities.__getitem__, group)) for color, group in self._by_color.items()}
+        rarities = {}
+        for rarity, group in rarity_groups.items():
+            rarities[rarity] = sum(map(_quantity, group))
+            self._by_rarity.setdefault(rarity.lower(), []).extend(group)
+        type_counts = {main_type: sum(map(_quantity, group)) for main_type, group in type_groups.items()}
+        total_quantity = sum(quantities)
+        
+        self._sets = sorted(sets)
+        types = {card_type for main_types in type_token_tuples for card_type in main_types}
+        types.discard('')
+        self._types = sorted(types - _TYPE_SUPERTYPES)
+        self._stats = {
+            'total_unique_cards': len(self._cards_cache),
+            'total_quantity': total_quantity,
+            'color_distribution': colors,
+            'rarity_distribution': rarities,
+            'type_distribution': type_counts
+        }
+    
+    def refresh_indexes(self) -> None:
+        """Rebuilds the indexes and statistics after in-memory card changes"""
+        with self._load_lock:
+            self._build_name_index()
+    
+    def set_card_quantity(self, card: Card, quantity: int) -> None:
+        """Sets a card's quantity and adjusts the statistics by the difference (indexes do not depend on it)"""
+        with self._load_lock:
+            difference = quantity - card.quantity
+            card.quantity = quantity
+            if not difference or self._stats is None:
+                return
+            
+            stats = self._stats
+            stats['total_quantity'] += difference
+            for color in card.color_identity:
+                stats['color_distribution'][color] = stats['color_distribution'].get(color, 0) + difference
+            if card.rarity:
+                rarities = stats['rarity_distribution']
+                rarities[card.rarity] = rarities.get(card.rarity, 0) + difference
+            if card.type_line:
+                main_type = card.main_type_tokens[-1]
+                stats['type_distribution'][main_type] = stats['type_distribution'].get(main_type, 0) + difference
     
     def find_card_by_name(self, name: str) -> Optional[Card]:
         """Searches for a card by name (case insensitive)"""
         if self._cards_by_name is None:
             self.load_cards()
         
-        return self._cards_by_name.get(name.lower())
+        # Repeated lookups of the same raw name skip lowercasing
+        try:
+            return self._lookup_cache[name]
+        except KeyError:
+            pass
+        
+        # Waits for an index being rebuilt, so a half-filled index is never memoized
+        with self._load_lock:
+            if len(self._lookup_cache) >= _LOOKUP_CACHE_SIZE:
+                self._lookup_cache.clear()
+            card = self._cards_by_name.get(name.lower())
+            self._lookup_cache[name] = card
+            return card
+    
+    def get_name_index(self) -> Dict[str, Card]:
+        """Gets the lowercase name -> card index (shared, do not modify)"""
+        with self._load_lock:
+            if self._cards_by_name is None or self._is_file_changed():
+                self.load_cards(force_reload=self._cards_by_name is not None)
+            
+            return self._cards_by_name
+    
+    def find_cards_by_names(self, names: List[str]) -> Dict[str, Optional[Card]]:
+        """Looks up several names at once (case insensitive), keyed by the given name"""
+        index = self.get_name_index()
+        return {name: index.get(name.lower()) for name in names}
+    
+    def _is_file_changed(self) -> bool:
+        """Checks if the CSV file changed on disk since the cards were loaded"""
+        if self._file_signature is None:
+            return False
+        try:
+            stat = self.data_path.stat()
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) != self._file_signature
+    
+    def _build_sorted_names(self) -> List[Tuple[str, int]]:
+        """Sorts every lowercase name and English name together with its card position"""
+        names = {(name_lower, index) for index, name_lower in enumerate(self._lower_names) if name_lower}
+        names.update((english_lower, index) for index, english_lower in enumerate(self._lower_english_names)
+                     if english_lower)
+        return sorted(names)
+    
+    def find_cards_by_prefix(self, prefix: str, limit: int = 50) -> List[Card]:
+        """Finds cards whose name starts with prefix (for autocomplete)"""
+        cards = self.load_cards()
+        
+        # Sorted on first use only, like the trigram index
+        if self._sorted_names is None:
+            self._sorted_names = self._build_sorted_names()
+        
+        sorted_names = self._sorted_names
+        prefix_lower = prefix.lower()
+        results = {}
+        position = bisect_left(sorted_names, (prefix_lower,))
+        while position < len(sorted_names) and len(results) < limit:
+            name_lower, index = sorted_names[position]
+            if not name_lower.startswith(prefix_lower):
+                break
+            results.setdefault(index, cards[index])
+            position += 1
+        
+        return list(results.values())
+    
+    def _build_trigram_index(self) -> Dict[str, List[int]]:
+        """Maps every 3-character substring of the lowercase names to the positions of its cards"""
+        trigrams: Dict[str, List[int]] = {}
+        for index, (name_lower, english_lower) in enumerate(zip(self._lower_names, self._lower_english_names)):
+            grams = {name_lower[i:i + 3] for i in range(len(name_lower) - 2)}
+            grams.update(english_lower[i:i + 3] for i in range(len(english_lower) - 2))
+            for gram in grams:
+                trigrams.setdefault(gram, []).append(index)
+        return trigrams
+    
+    def _search_candidates(self, query_lower: str) -> List[int]:
+        """Positions of the cards containing every trigram of the query, in collection order"""
+        if self._trigrams is None:
+            self._trigrams = self._build_trigram_index()
+        
+        postings = []
+        for gram in {query_lower[i:i + 3] for i in range(len(query_lower) - 2)}:
+            positions = self._trigrams.get(gram)
+            if positions is None:
+                return []
+            postings.append(positions)
+        
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(candidates)
     
     def search_cards(self, query: str, limit: int = 50) -> List[Card]:
         """Searches for cards that match the query"""
         cards = self.load_cards()
         query_lower = query.lower()
         
+        # Queries of 3+ characters only check the cards sharing all their trigrams
+        if len(query_lower) >= 3:
+            candidates = self._search_candidates(query_lower)
+        else:
+            candidates = range(len(cards))
+        
         results = []
-        for card in cards:
-            if (query_lower in card.card_name.lower() or 
-                (card.english_card_name and query_lower in card.english_card_name.lower())):
-                results.append(card)
+        names = self._lower_names
+        english_names = self._lower_english_names
+        for index in candidates:
+            if query_lower in names[index] or query_lower in english_names[index]:
+                results.append(cards[index])
                 if len(results) >= limit:
                     break
         
         return results
     
+    def _cards_at(self, groups: List[List[int]]) -> List[Card]:
+        """Cards at the positions of any of the groups, once each and in collection order"""
+        cards = self.cards
+        if len(groups) == 1:
+            return [cards[position] for position in groups[0]]
+        return [cards[position] for position in sorted(set().union(*groups))]
+    
     def get_cards_by_color(self, colors: List[str]) -> List[Card]:
         """Gets cards that contain the specified colors"""
-        cards = self.load_cards()
+        self.load_cards()
         
-        return [card for card in cards 
-                if any(color in card.color_identity for color in colors)]
+        # A multicolor card appears under several colors, keep it once
+        return self._cards_at([self._by_color.get(color, []) for color in set(colors)])
     
     def get_cards_by_type(self, card_type: str) -> List[Card]:
         """Gets cards of a specific type"""
         cards = self.load_cards()
+        type_lower = card_type.lower()
+        
+        # A term without spaces lies within one type word: merge every indexed word containing it
+        if type_lower and not any(char.isspace() for char in type_lower):
+            return self._cards_at([positions for token, positions in self._by_type_token.items()
+                                   if type_lower in token])
         
         return [card for card in cards 
-                if card.type_line and card_type.lower() in card.type_line.lower()]
+                if card.type_line and type_lower in card.type_line.lower()]
     
     def get_cards_by_rarity(self, rarity: str) -> List[Card]:
         """Gets cards of a specific rarity"""
-        cards = self.load_cards()
+        self.load_cards()
         
-        return [card for card in cards 
-                if card.rarity and card.rarity.lower() == rarity.lower()]
+        return list(self._by_rarity.get(rarity.lower(), ()))
     
     def get_cards_by_set(self, set_code: str) -> List[Card]:
         """Gets cards of a specific set"""
-        cards = self.load_cards()
+        self.load_cards()
         
-        return [card for card in cards 
-                if card.set_code and card.set_code.lower() == set_code.lower()]
+        return list(self._by_set.get(set_code.lower(), ()))
+    
+    def query(self, colors: Optional[List[str]] = None, card_type: Optional[str] = None,
+              rarity: Optional[str] = None, set_code: Optional[str] = None,
+              cards: Optional[List[Card]] = None) -> List[Card]:
+        """Gets cards matching all the given filters in a single pass"""
+        if cards is None:
+            # Start from the smallest indexed group, the remaining filters are checked per card
+            all_cards = self.cards
+            groups = []
+            if rarity:
+                groups.append(self._by_rarity.get(rarity.lower(), ()))
+            if set_code:
+                groups.append(self._by_set.get(set_code.lower(), ()))
+            if groups:
+                cards = min(groups, key=len)
+            elif colors:
+                cards = self.get_cards_by_color(colors)
+            elif card_type:
+                cards = self.get_cards_by_type(card_type)
+            else:
+                cards = all_cards
+        
+        rarity_lower = rarity.lower() if rarity else None
+        set_lower = set_code.lower() if set_code else None
+        type_lower = card_type.lower() if card_type else None
+        color_set = set(colors) if colors else None
+        
+        return [card for card in cards
+                if (rarity_lower is None or (card.rarity and card.rarity.lower() == rarity_lower))
+                and (set_lower is None or (card.set_code and card.set_code.lower() == set_lower))
+                and (color_set is None or not color_set.isdisjoint(card.color_identity))
+                and (type_lower is None or (card.type_line and type_lower in card.type_line.lower()))]
     
     def get_available_sets(self) -> List[str]:
         """Gets list of available sets"""
-        cards = self.load_cards()
-        sets = set()
-        
-        for card in cards:
-            if card.set_code:
-                sets.add(card.set_code)
+        self.load_cards()
         
-        return sorted(list(sets))
+        return list(self._sets)
     
     def get_available_types(self) -> List[str]:
         """Gets list of available card types"""
-        cards = self.load_cards()
-        types = set()
+        self.load_cards()
         
-        for card in cards:
-            if card.type_line:
-                # Extract main types
-                main_types = card.type_line.split(' — ')[0].split(' ')
-                for card_type in main_types:
-                    if card_type and card_type not in ['Legendary', 'Basic', 'Snow']:
-                        types.add(card_type)
-        
-        return sorted(list(types))
+        return list(self._types)
     
-    def get_statistics(self) -> Dict[str, any]:
+    def get_statistics(self) -> Dict[str, Any]:
         """Gets collection statistics"""
-        cards = self.load_cards()
+        self.load_cards()
         
-        total_cards = len(cards)
-        total_quantity = sum(card.quantity for card in cards)
-        
-        colors = {}
-        rarities = {}
-        types = {}
-        
-        for card in cards:
-            # Count colors
-            for color in card.color_identity:
-                colors[color] = colors.get(color, 0) + card.quantity
-            
-            # Count rarities
-            if card.rarity:
-                rarities[card.rarity] = rarities.get(card.rarity, 0) + card.quantity
-            
-            # Count types
-            if card.type_line:
-                main_type = card.type_line.split(' — ')[0].split(' ')[-1]
-                types[main_type] = types.get(main_type, 0) + card.quantity
-        
-        return {
-            'total_unique_cards': total_cards,
-            'total_quantity': total_quantity,
-            'color_distribution': colors,
-            'rarity_distribution': rarities,
-            'type_distribution': types
-        }
\ No newline at end of file
+        # Copies, so callers can change the result without touching the precomputed totals
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in self._stats.items()}
@@ -2,13 +2,63 @@
 
 import csv
 import json
-from typing import List, Dict, Optional, Any
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 
 from ..models.deck import Deck
 from ..models.card import Card
 from .card_service import CardService
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used without it
+    orjson = None
+
+# Metadata of saved decks; the leading dot can never come out of _safe_filename
+_DECK_INDEX_FILENAME = '.deck_index.json'
+
+# Threads used to read changed deck files while listing
+_LIST_DECKS_WORKERS = 8
+
+# Characters replaced in deck filenames (\w follows str.isalnum, so accented names are kept)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]')
+_SPACE_RUNS = re.compile(r' +')
+
+# Deck list lines: "2x Card Name", "2X Card Name" or "2 Card Name" (comment lines never start with a digit)
+_DECK_LINE = re.compile(r'^[ \t]*(?P<quantity>\d+)[ \t]*[xX]?[ \t]+(?P<name>.+?)[ \t]*$', re.MULTILINE)
+
+
+def _read_json(path: Path) -> Any:
+    """Parses a JSON file, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any, indent: bool = False) -> None:
+    """Writes data as UTF-8 JSON, with orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2 if indent else None)
+
+
+# Type keyword and section heading, in the order sections are exported
+_EXPORT_SECTIONS = (
+    ('creature', 'Creatures'),
+    ('instant', 'Instants'),
+    ('sorcery', 'Sorceries'),
+    ('enchantment', 'Enchantments'),
+    ('artifact', 'Artifacts'),
+    ('planeswalker', 'Planeswalkers'),
+    ('land', 'Lands'),
+)
+
 
 class DeckService:
     """Service for MTG deck operations"""
@@ -30,8 +80,11 @@ class DeckService:
             file_path = self.decks_dir / filename
             
             # Convert to dictionary and save as JSON
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(deck.to_dict(), f, ensure_ascii=False, indent=2)
+            deck_data = deck.to_dict()
+            _write_json(file_path, deck_data, indent=True)
+            
+            # Keep the listing index current so the next listing doesn't re-read this deck
+            self._update_deck_index(filename, self._deck_meta(deck_data, file_path.stat()))
             
             return True
         except Exception as e:
@@ -46,8 +99,7 @@ class DeckService:
             if not file_path.exists():
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                deck_data = json.load(f)
+            deck_data = _read_json(file_path)
             
             return Deck.from_dict(deck_data)
         except Exception as e:
@@ -59,25 +111,106 @@ class DeckService:
         decks = []
         
         try:
+            # Metadata is only re-read from decks whose file changed since the last listing
+            index = self._read_deck_index()
+            new_index = {}
+            stale = []
+            
             for file_path in self.decks_dir.glob('*.json'):
+                if file_path.name == _DECK_INDEX_FILENAME:
+                    continue
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        deck_data = json.load(f)
-                    
-                    decks.append({
-                        'name': deck_data.get('name', 'Unnamed'),
-                        'format': deck_data.get('format'),
-                        'card_count': len(deck_data.get('cards', [])),
-                        'filename': file_path.name
-                    })
-                except Exception as e:
+                    stat = file_path.stat()
+                except OSError as e:
                     print(f"Error reading deck {file_path.name}: {e}")
                     continue
+                
+                entry = index.get(file_path.name)
+                if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                    new_index[file_path.name] = entry
+                else:
+                    new_index[file_path.name] = None
+                    stale.append((file_path, stat))
+            
+            # Changed decks are read in parallel, file reads release the GIL
+            if len(stale) > 1:
+                with ThreadPoolExecutor(max_workers=min(_LIST_DECKS_WORKERS, len(stale))) as executor:
+                    entries = list(executor.map(self._read_deck_meta, stale))
+            else:
+                entries = [self._read_deck_meta(item) for item in stale]
+            
+            for (file_path, _), entry in zip(stale, entries):
+                new_index[file_path.name] = entry
+            
+            for filename, entry in list(new_index.items()):
+                if entry is None:
+                    del new_index[filename]
+                    continue
+                decks.append({
+                    'name': entry['name'],
+                    'format': entry['format'],
+                    'card_count': entry['card_count'],
+                    'filename': filename
+                })
+            
+            if new_index != index:
+                self._write_deck_index(new_index)
         except Exception as e:
             print(f"Error listing decks: {e}")
         
         return decks
     
+    def _read_deck_meta(self, item: Tuple[Path, os.stat_result]) -> Optional[Dict[str, Any]]:
+        """Reads the listing metadata of one deck file, None if it can't be read"""
+        file_path, stat = item
+        try:
+            return self._deck_meta(_read_json(file_path), stat)
+        except Exception as e:
+            print(f"Error reading deck {file_path.name}: {e}")
+            return None
+    
+    def _deck_meta(self, deck_data: Dict[str, Any], stat: os.stat_result) -> Dict[str, Any]:
+        """Builds the index entry of a deck from its data and file status"""
+        return {
+            'name': deck_data.get('name', 'Unnamed'),
+            'format': deck_data.get('format'),
+            'card_count': len(deck_data.get('cards', [])),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+    
+    def _update_deck_index(self, filename: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Sets (or removes, when entry is None) one deck in the listing index"""
+        index = self._read_deck_index()
+        if entry is None:
+            if index.pop(filename, None) is None:
+                return
+        else:
+            index[filename] = entry
+        self._write_deck_index(index)
+    
+    def _read_deck_index(self) -> Dict[str, Dict[str, Any]]:
+        """Reads the cached deck metadata, empty if missing or unreadable"""
+        try:
+            index = _read_json(self.decks_dir / _DECK_INDEX_FILENAME)
+            if isinstance(index, dict):
+                return index
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable deck index: {e}")
+        return {}
+    
+    def _write_deck_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Stores the deck metadata so later listings skip parsing unchanged decks"""
+        index_path = self.decks_dir / _DECK_INDEX_FILENAME
+        temp_path = index_path.with_suffix('.tmp')
+        try:
+            _write_json(temp_path, index)
+            os.replace(temp_path, index_path)
+        except Exception as e:
+            print(f"Could not write deck index: {e}")
+    
     def delete_deck(self, filename: str) -> bool:
         """Deletes a deck from disk"""
         try:
@@ -85,6 +218,7 @@ class DeckService:
             
             if file_path.exists():
                 file_path.unlink()
+                self._update_deck_index(filename, None)
                 return True
             
             return False
@@ -98,32 +232,22 @@ class DeckService:
             deck = self.create_deck(deck_name)
             path = Path(file_path)
             
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            entries = _DECK_LINE.findall(path.read_text(encoding='utf-8'))
+            cards_by_name = self.card_service.find_cards_by_names([card_name for _, card_name in entries])
             
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('//'):
-                    continue
-                
-                # Typical format: "2x Card Name" or "2 Card Name"
-                parts = line.split(' ', 1)
-                if len(parts) < 2:
-                    continue
-                
-                quantity_str = parts[0].rstrip('x')
-                card_name = parts[1].strip()
-                
-                try:
-                    quantity = int(quantity_str)
-                except ValueError:
-                    continue
-                
-                # Search for the card in the collection
-                card = self.card_service.find_card_by_name(card_name)
-                
+            # Merge repeated cards before adding them to the deck
+            found = {}
+            for quantity_str, card_name in entries:
+                card = cards_by_name[card_name]
                 if card:
-                    deck.add_card(card, quantity)
+                    entry = found.get(id(card))
+                    if entry:
+                        entry[1] += int(quantity_str)
+                    else:
+                        found[id(card)] = [card, int(quantity_str)]
+            
+            for card, quantity in found.values():
+                deck.add_card(card, quantity)
             
             return deck
         except Exception as e:
@@ -141,59 +265,17 @@ class DeckService:
                     f.write(f"// {deck.description}\n")
                 f.write(f"// Format: {deck.format or 'Not specified'}\n\n")
                 
-                # Group by types
-                creatures = deck.get_cards_by_type('Creature')
-                instants = deck.get_cards_by_type('Instant')
-                sorceries = deck.get_cards_by_type('Sorcery')
-                enchantments = deck.get_cards_by_type('Enchantment')
-                artifacts = deck.get_cards_by_type('Artifact')
-                planeswalkers = deck.get_cards_by_type('Planeswalker')
-                lands = deck.get_cards_by_type('Land')
-                other = [card for card in deck.cards if not any(card in group for group in 
-                         [creatures, instants, sorceries, enchantments, artifacts, planeswalkers, lands])]
+                # Group by types; a card with several types (e.g. Artifact Creature) is listed under each
+                buckets, other = self._group_by_section(deck)
                 
                 # Write by sections
-                if creatures:
-                    f.write("// Creatures\n")
-                    for card in sorted(creatures, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if instants:
-                    f.write("// Instants\n")
-                    for card in sorted(instants, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if sorceries:
-                    f.write("// Sorceries\n")
-                    for card in sorted(sorceries, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if enchantments:
-                    f.write("// Enchantments\n")
-                    for card in sorted(enchantments, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if artifacts:
-                    f.write("// Artifacts\n")
-                    for card in sorted(artifacts, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if planeswalkers:
-                    f.write("// Planeswalkers\n")
-                    for card in sorted(planeswalkers, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
-                
-                if lands:
-                    f.write("// Lands\n")
-                    for card in sorted(lands, key=lambda c: c.card_name):
-                        f.write(f"{card.quantity}x {card.card_name}\n")
-                    f.write("\n")
+                for _, heading in _EXPORT_SECTIONS:
+                    cards = buckets[heading]
+                    if cards:
+                        f.write(f"// {heading}\n")
+                        for card in sorted(cards, key=lambda c: c.card_name):
+                            f.write(f"{card.quantity}x {card.card_name}\n")
+                        f.write("\n")
                 
                 if other:
                     f.write("// Others\n")
@@ -215,88 +297,101 @@ class DeckService:
         deck = self.create_deck(deck_name, format="Commander")
         return deck
     
-    def compare_with_collection(self, deck: Deck) -> Dict[str, Any]:
+    def compare_with_collection(self, deck: Deck, 
+                                collection_by_name: Optional[Dict[str, Card]] = None) -> Dict[str, Any]:
         """Compares a deck with the user's collection"""
-        collection_cards = self.card_service.load_cards()
-        collection_by_name = {card.card_name.lower(): card for card in collection_cards if card.card_name}
+        # Callers may pass a prebuilt lowercase name index, otherwise reuse the service's one
+        if collection_by_name is None:
+            collection_by_name = self.card_service.get_name_index()
         
         missing_cards = []
         available_cards = []
         partial_cards = []
+        total_needed = 0
+        total_available = 0
+        total_missing = 0
         
         for deck_card in deck.cards:
             collection_card = collection_by_name.get(deck_card.card_name.lower())
+            needed = deck_card.quantity
+            total_needed += needed
             
             if not collection_card or collection_card.quantity == 0:
                 missing_cards.append({
                     'card': deck_card,
-                    'needed': deck_card.quantity,
+                    'needed': needed,
                     'available': 0
                 })
-            elif collection_card.quantity >= deck_card.quantity:
+                total_missing += needed
+            elif collection_card.quantity >= needed:
                 available_cards.append({
                     'card': deck_card,
-                    'needed': deck_card.quantity,
+                    'needed': needed,
                     'available': collection_card.quantity
                 })
+                total_available += collection_card.quantity
             else:
                 partial_cards.append({
                     'card': deck_card,
-                    'needed': deck_card.quantity,
+                    'needed': needed,
                     'available': collection_card.quantity,
-                    'missing': deck_card.quantity - collection_card.quantity
+                    'missing': needed - collection_card.quantity
                 })
+                total_available += collection_card.quantity
+                total_missing += needed - collection_card.quantity
         
         return {
             'missing_cards': missing_cards,
             'available_cards': available_cards,
             'partial_cards': partial_cards,
-            'total_cards_needed': sum(card.quantity for card in deck.cards),
-            'total_cards_available': sum(item['available'] for item in available_cards) + 
-                                    sum(item['available'] for item in partial_cards),
-            'total_cards_missing': sum(item['needed'] for item in missing_cards) + 
-                                  sum(item['missing'] for item in partial_cards),
+            'total_cards_needed': total_needed,
+            'total_cards_available': total_available,
+            'total_cards_missing': total_missing,
             'completion_percentage': round(
-                (sum(item['available'] for item in available_cards) + 
-                 sum(item['available'] for item in partial_cards)) / 
-                sum(card.quantity for card in deck.cards) * 100 
-                if sum(card.quantity for card in deck.cards) > 0 else 0, 2
+                total_available / total_needed * 100 if total_needed > 0 else 0, 2
             )
         }
     
     def analyze_deck(self, deck: Deck) -> Dict[str, Any]:
         """Analyzes a deck and provides statistics"""
+        color_distribution, mana_curve, type_distribution = deck.distributions()
+        buckets, _ = self._group_by_section(deck)
         return {
             'name': deck.name,
             'format': deck.format,
             'total_cards': deck.total_cards,
             'unique_cards': deck.unique_cards,
-            'color_distribution': deck.color_distribution,
-            'mana_curve': deck.mana_curve,
-            'type_distribution': deck.type_distribution,
-            'creatures': len(deck.get_cards_by_type('Creature')),
-            'instants': len(deck.get_cards_by_type('Instant')),
-            'sorceries': len(deck.get_cards_by_type('Sorcery')),
-            'enchantments': len(deck.get_cards_by_type('Enchantment')),
-            'artifacts': len(deck.get_cards_by_type('Artifact')),
-            'planeswalkers': len(deck.get_cards_by_type('Planeswalker')),
-            'lands': len(deck.get_cards_by_type('Land'))
+            'color_distribution': color_distribution,
+            'mana_curve': mana_curve,
+            'type_distribution': type_distribution,
+            'creatures': len(buckets['Creatures']),
+            'instants': len(buckets['Instants']),
+            'sorceries': len(buckets['Sorceries']),
+            'enchantments': len(buckets['Enchantments']),
+            'artifacts': len(buckets['Artifacts']),
+            'planeswalkers': len(buckets['Planeswalkers']),
+            'lands': len(buckets['Lands'])
         }
     
+    def _group_by_section(self, deck: Deck) -> Tuple[Dict[str, List[Card]], List[Card]]:
+        """Groups deck cards by type section in a single pass, plus the cards matching none"""
+        buckets = {heading: [] for _, heading in _EXPORT_SECTIONS}
+        other = []
+        for card in deck.cards:
+            type_line = card.type_line.lower() if card.type_line else ''
+            matched = False
+            for keyword, heading in _EXPORT_SECTIONS:
+                if keyword in type_line:
+                    buckets[heading].append(card)
+                    matched = True
+            if not matched:
+                other.append(card)
+        return buckets, other
+    
     def _safe_filename(self, name: str) -> str:
         """Converts a name to a safe filename"""
         # Replace unsafe characters
-        safe_name = ""
-        for char in name:
-            if char.isalnum() or char in "_- ":
-                safe_name += char
-            else:
-                safe_name += "_"
-        
-        # Remove leading and trailing spaces and replace multiple spaces
-        safe_name = safe_name.strip().replace("  ", " ")
-        
-        # Replace spaces with hyphens
-        safe_name = safe_name.replace(" ", "-")
+        safe_name = _UNSAFE_FILENAME_CHARS.sub('_', name)
         
-        return safe_name
\ No newline at end of file
+        # Remove leading and trailing spaces and replace space runs with hyphens
+        return _SPACE_RUNS.sub('-', safe_name.strip())
@@ -3,11 +3,36 @@
 import os
 import requests
 import hashlib
+from functools import lru_cache
 from PIL import Image, ImageTk
 import io
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Decoded and resized images kept in memory for repeated displays
+_PHOTO_CACHE_SIZE = 512
+
+# Decoded (and resized) PIL images; unlike PhotoImages these can be prepared off the Tk thread
+_IMAGE_CACHE_SIZE = 128
+
+
+def _resample_filter(size: Tuple[int, int]) -> Image.Resampling:
+    """Cheaper filters for small thumbnails, where LANCZOS makes no visible difference"""
+    longest = max(size)
+    if longest < 200:
+        return Image.Resampling.BILINEAR
+    if longest <= 500:
+        return Image.Resampling.BICUBIC
+    return Image.Resampling.LANCZOS
+
+
+@lru_cache(maxsize=4096)
+def _hash_url(url: str) -> str:
+    """Hash used as cache filename, memoized since views request the same URLs on every redraw"""
+    return hashlib.md5(url.encode()).hexdigest()
+
 
 class ImageService:
     """Service for downloading and caching card images"""
@@ -19,11 +44,13 @@ class ImageService:
         self.session.headers.update({
             'User-Agent': 'MTGDeckConstructor/1.0'
         })
+        self._photo_cache: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
+        self._image_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._image_cache_lock = threading.Lock()
     
     def _get_cache_filename(self, url: str) -> Path:
         """Generates a unique filename based on the URL"""
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.jpg"
+        return self.cache_dir / f"{_hash_url(url)}.jpg"
     
     def _download_image(self, url: str, timeout: int = 10) -> Optional[bytes]:
         """Downloads an image from a URL"""
@@ -38,8 +65,7 @@ class ImageService:
     def _save_image_to_cache(self, image_data: bytes, cache_file: Path) -> bool:
         """Saves image data to cache"""
         try:
-            with open(cache_file, 'wb') as f:
-                f.write(image_data)
+            cache_file.write_bytes(image_data)
             return True
         except Exception as e:
             print(f"Error saving image to cache: {e}")
@@ -48,15 +74,78 @@ class ImageService:
     def _load_image_from_cache(self, cache_file: Path) -> Optional[Image.Image]:
         """Loads an image from cache"""
         try:
-            if cache_file.exists():
-                return Image.open(cache_file)
+            # One read instead of PIL's incremental reads on an open file; a miss costs no extra stat
+            return Image.open(io.BytesIO(cache_file.read_bytes()))
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading image from cache: {e}")
         return None
     
     def _resize_image(self, image: Image.Image, size: Tuple[int, int]) -> Image.Image:
         """Resizes an image maintaining aspect ratio"""
-        image.thumbnail(size, Image.Resampling.LANCZOS)
+        image.thumbnail(size, _resample_filter(size))
+        return image
+    
+    def _get_cached_photo(self, key: tuple) -> Optional[ImageTk.PhotoImage]:
+        """Gets an already built PhotoImage, marking it as recently used"""
+        photo = self._photo_cache.get(key)
+        if photo is not None:
+            self._photo_cache.move_to_end(key)
+        return photo
+    
+    def _store_photo(self, key: tuple, photo: ImageTk.PhotoImage) -> ImageTk.PhotoImage:
+        """Stores a PhotoImage, evicting the least recently used ones"""
+        self._photo_cache[key] = photo
+        while len(self._photo_cache) > _PHOTO_CACHE_SIZE:
+            self._photo_cache.popitem(last=False)
+        return photo
+    
+    def _prepare_image(self, url: str, size: Optional[Tuple[int, int]], timeout: int,
+                       download: bool) -> Optional[Image.Image]:
+        """Decodes and resizes an image once, reusing it while it stays in the LRU"""
+        key = (url, size)
+        with self._image_cache_lock:
+            image = self._image_cache.get(key)
+            if image is not None:
+                self._image_cache.move_to_end(key)
+                return image
+        
+        cache_file = self._get_cache_filename(url)
+        
+        # Try loading from cache first
+        image = self._load_image_from_cache(cache_file)
+        
+        # If not in cache, download
+        if not image:
+            if not download:
+                return None
+            image_data = self._download_image(url, timeout)
+            if not image_data:
+                return None
+            
+            # Save to cache and decode the bytes already in memory
+            self._save_image_to_cache(image_data, cache_file)
+            try:
+                image = Image.open(io.BytesIO(image_data))
+            except Exception as e:
+                print(f"Error processing downloaded image: {e}")
+                return None
+        
+        # Resize if necessary
+        try:
+            if size:
+                image = self._resize_image(image, size)
+            else:
+                image.load()
+        except Exception as e:
+            print(f"Error decoding image: {e}")
+            return None
+        
+        with self._image_cache_lock:
+            self._image_cache[key] = image
+            while len(self._image_cache) > _IMAGE_CACHE_SIZE:
+                self._image_cache.popitem(last=False)
         return image
     
     def get_image_from_cache_only(self, url: str, size: Optional[Tuple[int, int]] = None) -> Optional[ImageTk.PhotoImage]:
@@ -64,15 +153,15 @@ class ImageService:
         if not url:
             return None
         
-        cache_file = self._get_cache_filename(url)
-        image = self._load_image_from_cache(cache_file)
+        photo = self._get_cached_photo((url, size))
+        if photo is not None:
+            return photo
+        
+        image = self._prepare_image(url, size, 0, download=False)
         
         if image:
-            if size:
-                image = self._resize_image(image, size)
-            
             try:
-                return ImageTk.PhotoImage(image)
+                return self._store_photo((url, size), ImageTk.PhotoImage(image))
             except Exception as e:
                 print(f"Error converting image to PhotoImage: {e}")
         
@@ -83,34 +172,24 @@ class ImageService:
         if not url:
             return None
         
-        cache_file = self._get_cache_filename(url)
-        
-        # Try loading from cache first
-        image = self._load_image_from_cache(cache_file)
+        photo = self._get_cached_photo((url, size))
+        if photo is not None:
+            return photo
         
-        # If not in cache, download
+        image = self._prepare_image(url, size, timeout, download=True)
         if not image:
-            image_data = self._download_image(url, timeout)
-            if image_data:
-                # Save to cache
-                self._save_image_to_cache(image_data, cache_file)
-                
-                # Load the image
-                try:
-                    image = Image.open(io.BytesIO(image_data))
-                except Exception as e:
-                    print(f"Error processing downloaded image: {e}")
-                    return None
-            else:
-                return None
-        
-        # Resize if necessary
-        if size:
-            image = self._resize_image(image, size)
+            return None
         
         # Convert to PhotoImage for Tkinter
+        return self.to_photo(url, size, image)
+    
+    def to_photo(self, url: str, size: Optional[Tuple[int, int]], image: Image.Image) -> Optional[ImageTk.PhotoImage]:
+        """Converts a prepared image to a PhotoImage, must run on the Tk thread"""
+        photo = self._get_cached_photo((url, size))
+        if photo is not None:
+            return photo
         try:
-            return ImageTk.PhotoImage(image)
+            return self._store_photo((url, size), ImageTk.PhotoImage(image))
         except Exception as e:
             print(f"Error converting image to PhotoImage: {e}")
             return None
@@ -140,42 +219,61 @@ class ImageService:
     def clear_cache(self) -> int:
         """Clears the image cache and returns the number of deleted files"""
         deleted_count = 0
+        self._photo_cache.clear()
+        with self._image_cache_lock:
+            self._image_cache.clear()
         
         try:
-            for file_path in self.cache_dir.glob("*.jpg"):
-                file_path.unlink()
-                deleted_count += 1
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.jpg') and entry.is_file():
+                        os.unlink(entry.path)
+                        deleted_count += 1
         except Exception as e:
             print(f"Error clearing cache: {e}")
         
         return deleted_count
     
+    def _scan_cache(self) -> Tuple[int, int]:
+        """Counts cached images and their total size in a single directory read"""
+        count = 0
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.jpg') and entry.is_file():
+                    count += 1
+                    total_size += entry.stat().st_size
+        return count, total_size
+    
     def get_cache_size(self) -> int:
         """Gets the cache size in bytes"""
-        total_size = 0
-        
         try:
-            for file_path in self.cache_dir.glob("*.jpg"):
-                total_size += file_path.stat().st_size
+            return self._scan_cache()[1]
         except Exception as e:
             print(f"Error calculating cache size: {e}")
-        
-        return total_size
+            return 0
     
     def get_cache_count(self) -> int:
         """Gets the number of images in cache"""
         try:
-            return len(list(self.cache_dir.glob("*.jpg")))
+            with os.scandir(self.cache_dir) as entries:
+                return sum(1 for entry in entries if entry.name.endswith('.jpg') and entry.is_file())
         except Exception as e:
             print(f"Error counting files in cache: {e}")
             return 0
     
     def get_cache_info(self) -> dict:
         """Gets complete cache information"""
+        try:
+            count, size_bytes = self._scan_cache()
+        except Exception as e:
+            print(f"Error reading cache information: {e}")
+            count, size_bytes = 0, 0
+        
         return {
-            'count': self.get_cache_count(),
-            'size_bytes': self.get_cache_size(),
-            'size_mb': round(self.get_cache_size() / (1024 * 1024), 2),
+            'count': count,
+            'size_bytes': size_bytes,
+            'size_mb': round(size_bytes / (1024 * 1024), 2),
             'cache_dir': str(self.cache_dir)
         }
     
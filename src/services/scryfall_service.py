@@ -1,44 +1,184 @@
 """Service for interacting with the Scryfall API"""
 
 import requests
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from typing import Optional, Dict, Any, List, Tuple, Iterator
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used without it
+    orjson = None
+
+
+# Concurrent lookups overlap round trips; the rate limiter still spaces the requests out
+_BATCH_WORKERS = 8
+
+# Responses kept in memory; card data rarely changes within a day. Only single objects are cached
+# (search pages are not), so 1024 entries stay within a few MB
+_CACHE_SIZE = 1024
+_CACHE_TTL = 24 * 60 * 60
+
+# How long an expired response with an ETag is kept for revalidation before it is dropped
+_STALE_TTL = 7 * 24 * 60 * 60
+
+# Unknown names are cached briefly so repeated validations don't hammer the API
+_NOT_FOUND_TTL = 60
+
+# Maximum identifiers accepted by the /cards/collection endpoint per request
+_COLLECTION_CHUNK = 75
+
+# Pages walked by iter_search unless told otherwise (Scryfall returns up to 175 cards per page)
+_SEARCH_MAX_PAGES = 5
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Parses a response body, with orjson straight from the raw bytes when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: bursts up to capacity, then refills at rate tokens per second"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Takes a token, sleeping only when the bucket is empty"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # A negative balance reserves a future token, so waiting callers keep their order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
 
 class ScryfallService:
     """Service for Scryfall API queries"""
     
     BASE_URL = "https://api.scryfall.com"
-    RATE_LIMIT_DELAY = 0.1  # 100ms between requests to respect rate limits
+    RATE_LIMIT_DELAY = 0.1  # 100ms between requests on average to respect rate limits
+    RATE_LIMIT_BURST = 10  # Requests that may go out at once after being idle
     
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'MTGDeckConstructor/1.0'
+            'User-Agent': 'MTGDeckConstructor/1.0',
+            'Accept': 'application/json',
+            # Includes br when a brotli decoder is installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
-        self._last_request_time = 0
+        # One keep-alive connection per batch worker, so concurrent lookups don't redo TLS handshakes
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_BATCH_WORKERS)
+        self.session.mount('https://', adapter)
+        self._limiter = _TokenBucket(1 / self.RATE_LIMIT_DELAY, self.RATE_LIMIT_BURST)
+        # Entries are (expires_at, data, etag); expired entries with an ETag are kept for revalidation up to _STALE_TTL
+        self._cache: "OrderedDict[tuple, Tuple[float, Optional[Dict[str, Any]], Optional[str]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _rate_limit(self) -> None:
-        """Implements rate limiting to respect Scryfall limits"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Implements rate limiting to respect Scryfall limits, also across threads"""
+        self._limiter.acquire()
+    
+    def _get_cached(self, key: tuple) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Gets a cached response that has not expired, marking it as recently used"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False, None
+            now = time.monotonic()
+            if entry[0] <= now:
+                if entry[2] is None or entry[0] + _STALE_TTL <= now:
+                    del self._cache[key]
+                return False, None
+            self._cache.move_to_end(key)
+            return True, entry[1]
+    
+    def _get_stale(self, key: tuple) -> Optional[Tuple[Optional[Dict[str, Any]], str]]:
+        """Gets the data and ETag of an expired response that can be revalidated"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None or entry[2] is None or entry[0] + _STALE_TTL <= time.monotonic():
+                return None
+            return entry[1], entry[2]
+    
+    def _store_cached(self, key: tuple, data: Optional[Dict[str, Any]], ttl: float,
+                      etag: Optional[str] = None) -> None:
+        """Stores a response, evicting the least recently used ones"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, data, etag)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Clears the cached responses"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                      bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Makes an HTTP request to Scryfall with error handling, reusing recent responses"""
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        stale = None
+        if not bypass_cache:
+            found, data = self._get_cached(key)
+            if found:
+                return data
+            stale = self._get_stale(key)
+        
+        self._rate_limit()
         
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
+        url = f"{self.BASE_URL}/{endpoint}"
+        # An expired response is revalidated; if unchanged the body is neither sent nor parsed
+        headers = {'If-None-Match': stale[1]} if stale else None
         
-        self._last_request_time = time.time()
+        try:
+            response = self.session.get(url, params=params, timeout=10, headers=headers)
+            if stale and response.status_code == 304:
+                self._store_cached(key, stale[0], _CACHE_TTL, stale[1])
+                return stale[0]
+            if response.status_code == 404 and not bypass_cache:
+                self._store_cached(key, None, _NOT_FOUND_TTL)
+            response.raise_for_status()
+            data = _parse_json(response)
+        except requests.exceptions.RequestException as e:
+            print(f"Error in Scryfall request: {e}")
+            return None
+        except ValueError as e:
+            print(f"Error parsing JSON response: {e}")
+            return None
+        
+        if not bypass_cache:
+            etag = response.headers.get('ETag')
+            self._store_cached(key, data, _CACHE_TTL, etag if isinstance(etag, str) else None)
+        return data
     
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
-        """Makes an HTTP request to Scryfall with error handling"""
+    def _post_request(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Makes a POST request to Scryfall with error handling"""
         self._rate_limit()
         
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.post(url, json=payload, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Error in Scryfall request: {e}")
             return None
@@ -46,6 +186,50 @@ class ScryfallService:
             print(f"Error parsing JSON response: {e}")
             return None
     
+    def get_cards_bulk(self, names: List[str],
+                       max_workers: int = _BATCH_WORKERS) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Gets several cards by exact name with the collection endpoint, 75 names per request"""
+        results = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            found, card_data = self._get_cached(("cards/named", (('exact', name),)))
+            if found:
+                results[name] = card_data
+            else:
+                missing.append(name)
+        if not missing:
+            return results
+        
+        chunks = [missing[i:i + _COLLECTION_CHUNK] for i in range(0, len(missing), _COLLECTION_CHUNK)]
+        payloads = [{'identifiers': [{'name': name} for name in chunk]} for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(payloads))) as executor:
+            responses = list(executor.map(lambda payload: self._post_request("cards/collection", payload), payloads))
+        
+        # Cards come back without the requested names; double-faced cards match by either face
+        cards_by_name = {}
+        failed = set()
+        for chunk, response in zip(chunks, responses):
+            if response is None:
+                failed.update(chunk)
+                continue
+            for card_data in response.get('data', []):
+                cards_by_name[card_data.get('name', '').lower()] = card_data
+                for face in card_data.get('card_faces', []):
+                    cards_by_name.setdefault(face.get('name', '').lower(), card_data)
+        
+        for name in missing:
+            card_data = cards_by_name.get(name.lower())
+            results[name] = card_data
+            # Remember the answer as an exact lookup, unless the request itself failed
+            if name not in failed:
+                self._store_cached(("cards/named", (('exact', name),)), card_data,
+                                   _CACHE_TTL if card_data else _NOT_FOUND_TTL)
+        return results
+    
+    def validate_card_names(self, names: List[str]) -> Dict[str, bool]:
+        """Validates several card names with bulk requests"""
+        return {name: card_data is not None for name, card_data in self.get_cards_bulk(names).items()}
+    
     def get_card_by_name(self, name: str, exact: bool = False) -> Optional[Dict[str, Any]]:
         """Searches for a card by name"""
         endpoint = "cards/named"
@@ -55,6 +239,26 @@ class ScryfallService:
         
         return self._make_request(endpoint, params)
     
+    def _card_by_name_cached(self, name: str, exact: bool = False) -> Optional[Dict[str, Any]]:
+        """Gets a card by name, reusing a cached exact or fuzzy lookup of the same name"""
+        other_key = ("cards/named", (('fuzzy' if exact else 'exact', name),))
+        found, card_data = self._get_cached(other_key)
+        # A fuzzy match only answers an exact lookup when it resolved to that very name
+        if found and card_data and (not exact or card_data.get('name', '').lower() == name.lower()):
+            return card_data
+        return self.get_card_by_name(name, exact)
+    
+    def batch_get_card_by_name(self, names: List[str], exact: bool = False,
+                               max_workers: int = _BATCH_WORKERS) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Searches for several cards by name concurrently"""
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_names))) as executor:
+            results = executor.map(lambda name: self.get_card_by_name(name, exact), unique_names)
+            return dict(zip(unique_names, results))
+    
     def get_card_by_id(self, scryfall_id: str) -> Optional[Dict[str, Any]]:
         """Gets a card by its Scryfall ID"""
         endpoint = f"cards/{scryfall_id}"
@@ -62,21 +266,39 @@ class ScryfallService:
     
     def search_cards(self, query: str, page: int = 1) -> Optional[Dict[str, Any]]:
         """Searches for cards using Scryfall search syntax"""
-        endpoint = "cards/search"
-        params = {
-            'q': query,
-            'page': page
-        }
-        
-        return self._make_request(endpoint, params)
+        # Pages hold up to 175 full card objects, too large for the response cache
+        return self._search_page(query, page)
+    
+    def _search_page(self, query: str, page: int) -> Optional[Dict[str, Any]]:
+        """Fetches one search page without caching it, callers keep only the cards they need"""
+        return self._make_request("cards/search", {'q': query, 'page': page}, bypass_cache=True)
+    
+    def iter_search(self, query: str, max_pages: int = _SEARCH_MAX_PAGES) -> Iterator[Dict[str, Any]]:
+        """Yields the cards of a search up to max_pages, fetching the next page while the current one is consumed"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            data = self._search_page(query, page)
+            while data:
+                more = data.get('has_more') and page < max_pages
+                next_data = executor.submit(self._search_page, query, page + 1) if more else None
+                yield from data.get('data', [])
+                if next_data is None:
+                    break
+                data = next_data.result()
+                page += 1
     
     def get_card_image_url(self, card_name: str, image_type: str = 'normal') -> Optional[str]:
         """Gets the image URL of a card"""
-        card_data = self.get_card_by_name(card_name)
+        card_data = self._card_by_name_cached(card_name)
         
         if not card_data:
             return None
         
+        return self.image_url_from_data(card_data, image_type)
+    
+    @staticmethod
+    def image_url_from_data(card_data: Dict[str, Any], image_type: str = 'normal') -> Optional[str]:
+        """Picks the image URL from already fetched card data"""
         image_uris = card_data.get('image_uris', {})
         
         # Image type priority
@@ -99,7 +321,7 @@ class ScryfallService:
     def get_random_card(self) -> Optional[Dict[str, Any]]:
         """Gets a random card"""
         endpoint = "cards/random"
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, bypass_cache=True)
     
     def get_set_info(self, set_code: str) -> Optional[Dict[str, Any]]:
         """Gets information about a set"""
@@ -130,12 +352,12 @@ class ScryfallService:
     
     def validate_card_name(self, name: str) -> bool:
         """Validates if a card name exists in Scryfall"""
-        card_data = self.get_card_by_name(name, exact=True)
+        card_data = self._card_by_name_cached(name, exact=True)
         return card_data is not None
     
     def get_card_legalities(self, card_name: str) -> Optional[Dict[str, str]]:
         """Gets the legalities of a card in different formats"""
-        card_data = self.get_card_by_name(card_name)
+        card_data = self._card_by_name_cached(card_name)
         
         if card_data and 'legalities' in card_data:
             return card_data['legalities']
@@ -155,4 +377,21 @@ class ScryfallService:
     def search_by_format(self, format_name: str, legality: str = "legal") -> Optional[Dict[str, Any]]:
         """Searches for cards legal in a specific format"""
         query = f"format:{format_name} legal:{legality}"
-        return self.search_cards(query)
\ No newline at end of file
+        return self.search_cards(query)
+
+
+# Global instance
+_service_instance: Optional[ScryfallService] = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> ScryfallService:
+    """Gets the shared Scryfall service, so the session, cache and rate limit are shared app-wide"""
+    global _service_instance
+    
+    if _service_instance is None:
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = ScryfallService()
+    
+    return _service_instance
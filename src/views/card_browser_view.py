@@ -3,10 +3,37 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Set
 
 from ..controllers.app_controller import AppController
 from ..models.card import Card
+from .virtual_treeview import VirtualTreeview
+
+# Color filter options mapped to the color codes stored on cards
+_COLOR_CODES = {'White': 'W', 'Blue': 'U', 'Black': 'B', 'Red': 'R', 'Green': 'G'}
+
+# Rows of the details panel: (key, label)
+_DETAIL_FIELDS = (
+    ('name', 'Name'),
+    ('mana_cost', 'Mana Cost'),
+    ('type', 'Type'),
+    ('rarity', 'Rarity'),
+    ('set', 'Set'),
+    ('text', 'Text'),
+    ('power', 'Power/Toughness')
+)
+
+# Typing pause before the real-time search runs
+_SEARCH_DEBOUNCE_MS = 300
+
+# How often the Tk thread checks for the cards loaded in the background
+_LOAD_POLL_MS = 50
+
+# Search results kept per term; CardService.search_cards stops at 50 results, so fuller lists may be cut
+_SEARCH_CACHE_SIZE = 64
+_SEARCH_RESULT_LIMIT = 50
 
 
 class CardBrowserView:
@@ -18,10 +45,20 @@ class CardBrowserView:
         self.logger = logging.getLogger('MTGDeckConstructor.CardBrowserView')
         
         self.current_cards: List[Card] = []
+        # Unfiltered cards from the last load or search, with positions indexed by filter value
+        self._base_cards: List[Card] = []
+        self._base_rows: List[tuple] = []
+        self._idx_by_color: Dict[str, Set[int]] = {}
+        self._idx_by_type: Dict[str, Set[int]] = {}
+        self._idx_by_rarity: Dict[str, Set[int]] = {}
         self.frame = None
+        self._search_after_id = None
+        self._loading = False
+        self._load_queue: queue.Queue = queue.Queue()
+        self._search_cache: Dict[str, List[Card]] = {}
+        self._last_search: Optional[Tuple[str, List[Card]]] = None
         
-        self._create_interface()
-        self._load_initial_cards()
+        # The widgets are built and the cards loaded on the first show()
     
     def _create_interface(self):
         """Creates the card browser interface"""
@@ -52,6 +89,7 @@ class CardBrowserView:
         search_entry = ttk.Entry(row1_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=(0, 10))
         search_entry.bind('<KeyRelease>', self._on_search_changed)
+        search_entry.bind('<Return>', lambda event: self._perform_search())
         
         ttk.Button(row1_frame, text="Search", command=self._perform_search).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(row1_frame, text="Clear", command=self._clear_search).pack(side=tk.LEFT)
@@ -111,10 +149,11 @@ class CardBrowserView:
         self.cards_tree.column('rarity', width=100)
         self.cards_tree.column('set', width=80)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.cards_tree.yview)
+        # Scrollbars; the vertical one scrolls the virtual rows, only the visible ones are tree items
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.cards_tree.xview)
-        self.cards_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.cards_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.virtual_tree = VirtualTreeview(self.cards_tree, v_scrollbar)
         
         # Pack
         self.cards_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -152,111 +191,203 @@ class CardBrowserView:
         text_frame = ttk.Frame(content_frame)
         text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.details_text = tk.Text(text_frame, height=8, width=50, wrap=tk.WORD)
-        details_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.details_text.yview)
-        self.details_text.configure(yscrollcommand=details_scrollbar.set)
-        
-        self.details_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        details_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Fixed label grid; showing a card only sets the variables, no text widget is edited
+        self._detail_vars: Dict[str, tk.StringVar] = {}
+        for row, (key, title) in enumerate(_DETAIL_FIELDS):
+            self._detail_vars[key] = tk.StringVar()
+            ttk.Label(text_frame, text=f"{title}:").grid(row=row, column=0, sticky='nw', padx=(0, 5))
+            ttk.Label(text_frame, textvariable=self._detail_vars[key], wraplength=400,
+                      justify=tk.LEFT).grid(row=row, column=1, sticky='w')
+        text_frame.columnconfigure(1, weight=1)
     
     def _load_initial_cards(self):
-        """Loads initial cards"""
+        """Loads initial cards in the background, so the window paints right away"""
+        # A load in progress already brings the same cards
+        if self._loading:
+            return
+        self._loading = True
+        self.results_label.config(text="Loading cards...")
+        threading.Thread(target=self._load_cards_in_background, daemon=True).start()
+        self.frame.after(_LOAD_POLL_MS, self._poll_load_queue)
+    
+    def _load_cards_in_background(self):
+        """Reads the cards off the Tk thread and queues the outcome (Tk is never called from here)"""
         try:
             # Load all cards (limited for performance)
             all_cards = self.app_controller.get_all_cards()[:1000]  # Limit to 1000
-            self._update_cards_display(all_cards)
         except Exception as e:
             self.logger.error(f"Error loading initial cards: {e}")
-            messagebox.showerror("Error", f"Error loading cards: {e}")
+            self._load_queue.put((self._on_load_failed, e))
+            return
+        
+        self._load_queue.put((self._on_cards_loaded, all_cards))
+    
+    def _poll_load_queue(self):
+        """Delivers the background load on the Tk thread once it has finished"""
+        try:
+            callback, result = self._load_queue.get_nowait()
+        except queue.Empty:
+            self.frame.after(_LOAD_POLL_MS, self._poll_load_queue)
+            return
+        
+        callback(result)
+    
+    def _on_cards_loaded(self, cards: List[Card]):
+        """Shows the cards loaded in the background"""
+        self._loading = False
+        self._apply_filters(cards)
+    
+    def _on_load_failed(self, error: Exception):
+        """Reports a failed background load"""
+        self._loading = False
+        self.results_label.config(text="Cards found: 0")
+        messagebox.showerror("Error", f"Error loading cards: {error}")
     
     def _on_search_changed(self, event=None):
         """Handles real-time changes in search"""
+        # Restart the wait on every keystroke, so only the last one searches
+        if self._search_after_id:
+            self.frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
         # Real-time search only if there are more than 2 characters
         search_term = self.search_var.get().strip()
         if len(search_term) >= 3:
-            self._perform_search()
+            self._search_after_id = self.frame.after(_SEARCH_DEBOUNCE_MS, self._perform_search)
     
     def _perform_search(self):
         """Performs card search"""
+        if self._search_after_id:
+            self.frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
         try:
             search_term = self.search_var.get().strip()
             if not search_term:
                 self._load_initial_cards()
                 return
             
-            results = self.app_controller.search_cards(search_term)
-            self._apply_filters(results)
+            self._apply_filters(self._search(search_term))
             
         except Exception as e:
             self.logger.error(f"Search error: {e}")
             messagebox.showerror("Error", f"Search error: {e}")
     
+    def _search(self, search_term: str) -> List[Card]:
+        """Searches for a term, reusing earlier results instead of asking the controller again"""
+        term = search_term.lower()
+        results = self._search_cache.get(term)
+        if results is None:
+            previous = self._last_search
+            if previous and term.startswith(previous[0]) and len(previous[1]) < _SEARCH_RESULT_LIMIT:
+                # A longer term can only match cards that matched the shorter one
+                results = [card for card in previous[1]
+                           if term in card.card_name.lower() or term in (card.english_card_name or '').lower()]
+            else:
+                results = self.app_controller.search_cards(search_term)
+            
+            if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[term] = results
+        
+        self._last_search = (term, results)
+        return results
+    
+    def _invalidate_search_cache(self):
+        """Forgets cached search results, e.g. when the cards are reloaded"""
+        self._search_cache.clear()
+        self._last_search = None
+    
     def _on_filter_changed(self, event=None):
         """Handles filter changes"""
-        # Apply filters to current cards
-        if hasattr(self, 'current_cards'):
-            self._apply_filters(self.current_cards)
+        # Filter the cards already loaded, without searching again
+        self._apply_filters()
+    
+    def _index_cards(self, cards: List[Card]):
+        """Indexes the positions of the cards by color identity (as CardService does), main type and rarity"""
+        by_color: Dict[str, Set[int]] = {}
+        by_type: Dict[str, Set[int]] = {}
+        by_rarity: Dict[str, Set[int]] = {}
+        for index, card in enumerate(cards):
+            colors = card.color_identity
+            for color in colors:
+                by_color.setdefault(color, set()).add(index)
+            if not colors:
+                by_color.setdefault("Colorless", set()).add(index)
+            elif len(colors) > 1:
+                by_color.setdefault("Multicolor", set()).add(index)
+            for token in card.main_type_tokens:
+                by_type.setdefault(token, set()).add(index)
+            by_rarity.setdefault((card.rarity or '').lower(), set()).add(index)
+        
+        self._base_cards = cards
+        self._base_rows = self._display_rows(cards)
+        self._idx_by_color = by_color
+        self._idx_by_type = by_type
+        self._idx_by_rarity = by_rarity
     
-    def _apply_filters(self, cards: List[Card]):
-        """Applies selected filters to the card list"""
-        filtered_cards = cards.copy()
+    def _apply_filters(self, cards: Optional[List[Card]] = None):
+        """Applies selected filters to the card list (or to the last loaded list)"""
+        if cards is not None:
+            self._index_cards(cards)
         
-        # Color filter
         color_filter = self.color_var.get()
-        if color_filter != "All":
-            # Basic color filter implementation
-            pass  # TODO: Implement color filter
-        
-        # Type filter
         type_filter = self.type_var.get()
-        if type_filter != "All":
-            # Basic type filter implementation
-            pass  # TODO: Implement type filter
+        rarity_filter = self.rarity_var.get().lower()
         
-        # Rarity filter
-        rarity_filter = self.rarity_var.get()
-        if rarity_filter != "All":
-            # Basic rarity filter implementation
-            pass  # TODO: Implement rarity filter
-        
-        self._update_cards_display(filtered_cards)
+        # Each active filter contributes the set of matching positions
+        matches = []
+        if color_filter != "All":
+            matches.append(self._idx_by_color.get(_COLOR_CODES.get(color_filter, color_filter), set()))
+        if type_filter != "All":
+            matches.append(self._idx_by_type.get(type_filter, set()))
+        if rarity_filter != "all":
+            matches.append(self._idx_by_rarity.get(rarity_filter, set()))
+        
+        if matches:
+            # Intersect starting from the smallest set, then keep the original order
+            matches.sort(key=len)
+            positions = sorted(matches[0].intersection(*matches[1:]))
+            filtered_cards = [self._base_cards[index] for index in positions]
+            rows = [self._base_rows[index] for index in positions]
+        else:
+            filtered_cards = self._base_cards
+            rows = self._base_rows
+        
+        self._update_cards_display(filtered_cards, rows)
     
-    def _update_cards_display(self, cards: List[Card]):
-        """Updates the card display"""
-        # Clear tree
-        for item in self.cards_tree.get_children():
-            self.cards_tree.delete(item)
-        
-        # Add cards
+    def _display_rows(self, cards: List[Card]) -> List[tuple]:
+        """Builds the displayed values of each card; Card always defines these fields"""
+        return [(
+            card.card_name,
+            card.mana_cost or '',
+            card.type_line or '',
+            card.rarity or '',
+            card.set_code or ''
+        ) for card in cards]
+    
+    def _update_cards_display(self, cards: List[Card], rows: Optional[List[tuple]] = None):
+        """Updates the card display, reusing the rows already built for these cards if given"""
         self.current_cards = cards
-        for card in cards:
-            self.cards_tree.insert('', tk.END, values=(
-                card.card_name,
-                getattr(card, 'mana_cost', ''),
-                getattr(card, 'type_line', ''),
-                getattr(card, 'rarity', ''),
-                getattr(card, 'set_code', '')
-            ))
+        if rows is None:
+            rows = self._display_rows(cards)
+        
+        # Only the visible rows become tree items, whatever the number of cards
+        self.virtual_tree.set_rows(rows)
         
         # Update counter
         self.results_label.config(text=f"Cards found: {len(cards)}")
     
     def _on_card_selected(self, event=None):
         """Handles card selection"""
+        # Selection moves made by the virtual tree while scrolling are not the user's
         selection = self.cards_tree.selection()
-        if not selection:
+        if self.virtual_tree.updating_selection or not selection:
             return
         
-        # Get selected card data
-        item = self.cards_tree.item(selection[0])
-        card_name = item['values'][0]
-        
-        # Search for the card in current list
-        selected_card = None
-        for card in self.current_cards:
-            if card.card_name == card_name:
-                selected_card = card
-                break
+        # Tree items are reused while scrolling, the virtual tree knows which row is selected
+        index = self.virtual_tree.selected_index()
+        selected_card = self.current_cards[index] if index is not None and index < len(self.current_cards) else None
         
         if selected_card:
             self._show_card_details(selected_card)
@@ -268,23 +399,18 @@ class CardBrowserView:
     
     def _show_card_details(self, card: Card):
         """Shows card details"""
-        # Clear previous text
-        self.details_text.delete(1.0, tk.END)
-        
-        # Show card information
-        details = f"Name: {card.card_name}\n"
-        details += f"Mana Cost: {getattr(card, 'mana_cost', 'N/A')}\n"
-        details += f"Type: {getattr(card, 'type_line', 'N/A')}\n"
-        details += f"Rarity: {getattr(card, 'rarity', 'N/A')}\n"
-        details += f"Set: {getattr(card, 'set_code', 'N/A')}\n\n"
-        
-        if hasattr(card, 'oracle_text'):
-            details += f"Text: {card.oracle_text}\n\n"
-        
-        if hasattr(card, 'power') and hasattr(card, 'toughness'):
-            details += f"Power/Toughness: {card.power}/{card.toughness}\n"
-        
-        self.details_text.insert(1.0, details)
+        has_power = card.power is not None and card.toughness is not None
+        details = {
+            'name': card.card_name,
+            'mana_cost': card.mana_cost or 'N/A',
+            'type': card.type_line or 'N/A',
+            'rarity': card.rarity or 'N/A',
+            'set': card.set_code or 'N/A',
+            'text': card.oracle_text or '',
+            'power': f"{card.power}/{card.toughness}" if has_power else ''
+        }
+        for key, value in details.items():
+            self._detail_vars[key].set(value)
         
         # TODO: Load card image
         self.card_image_label.config(text=f"Image of\n{card.card_name}\n(Not available)")
@@ -292,14 +418,18 @@ class CardBrowserView:
     def _clear_search(self):
         """Clears search and filters"""
         self.search_var.set("")
-        self.color_var.set("Todos")
-        self.type_var.set("Todos")
-        self.rarity_var.set("Todas")
+        self.color_var.set("All")
+        self.type_var.set("All")
+        self.rarity_var.set("All")
+        self._invalidate_search_cache()
         self._load_initial_cards()
     
     def show(self):
-        """Shows the view"""
-        if self.frame:
+        """Shows the view, building it the first time"""
+        if self.frame is None:
+            self._create_interface()
+            self._load_initial_cards()
+        else:
             self.frame.pack(fill=tk.BOTH, expand=True)
     
     def hide(self):
@@ -309,4 +439,6 @@ class CardBrowserView:
     
     def refresh(self):
         """Refresca la vista"""
-        self._load_initial_cards()
\ No newline at end of file
+        self._invalidate_search_cache()
+        if self.frame is not None:
+            self._load_initial_cards()
\ No newline at end of file
@@ -2,11 +2,35 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
+import bisect
+import csv
+import io
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from ..controllers.app_controller import AppController
 from ..models.card import Card
+from .virtual_treeview import VirtualTreeview
+
+# Wait after the last keystroke before filtering the collection
+_SEARCH_DEBOUNCE_MS = 150
+
+# Time a status message stays visible
+_STATUS_CLEAR_MS = 3000
+
+# Rarity ids counted in the statistics; any other or unknown rarity counts as _OTHER_RARITY
+_RARITY_IDS = {'common': 0, 'uncommon': 1, 'rare': 2, 'mythic': 3}
+_OTHER_RARITY = 4
+
+# Card fields kept per collection name: name, mana cost, type, rarity, set (displayed) and rarity id
+_CardInfo = Tuple[str, str, str, str, str, int]
+
+# Text collection line: "4 Lightning Bolt" or "4x Lightning Bolt"
+_COLLECTION_LINE = re.compile(r'^\s*(\d+)\s*[xX]?\s+(.+?)\s*$')
 
 
 class CollectionView:
@@ -20,8 +44,28 @@ class CollectionView:
         self.collection_cards: Dict[str, int] = {}  # card_name -> quantity
         self.frame = None
         
-        self._create_interface()
-        self._load_collection()
+        # Database lookups per collection name (None when the card is not in the database)
+        self._card_info_cache: Dict[str, Optional[_CardInfo]] = {}
+        self._search_after_id = None
+        self._last_search: Optional[Tuple[str, bool]] = None
+        self._status_after_id = None
+        
+        # Displayed rows and the collection name of each one, so a change only touches its own row
+        self._rows: List[tuple] = []
+        self._row_names: List[str] = []
+        self._row_positions: Dict[str, int] = {}
+        
+        # 3-character substrings of the lowercase names -> collection names containing them
+        self._name_index: Dict[str, Set[str]] = {}
+        # Lowercase names kept sorted (with the collection names in the same order) for prefix searches
+        self._sorted_lower_names: List[str] = []
+        self._sorted_names: List[str] = []
+        
+        # Running totals for the statistics, updated with each change instead of recounted
+        self._total_quantity = 0
+        self._rarity_totals: List[int] = [0] * (_OTHER_RARITY + 1)  # rarity id -> quantity
+        # Rarity id each name is counted under, so removals undo exactly what was added
+        self._counted_rarity: Dict[str, int] = {}
     
     def _create_interface(self):
         """Creates the main interface"""
@@ -37,6 +81,10 @@ class CollectionView:
         
         # Panel inferior - estadísticas
         self._create_stats_panel()
+        
+        # Inline feedback for successful actions, instead of a dialog each time
+        self.status_var = tk.StringVar()
+        ttk.Label(self.frame, textvariable=self.status_var).pack(fill=tk.X, pady=(5, 0))
     
     def _create_tools_panel(self):
         """Crea el panel de herramientas"""
@@ -111,10 +159,11 @@ class CollectionView:
         self.collection_tree.column('set', width=60)
         self.collection_tree.column('value', width=80)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.collection_tree.yview)
+        # Scrollbars; the vertical one scrolls the virtual rows, only the visible ones are tree items
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.collection_tree.xview)
-        self.collection_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.collection_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.virtual_tree = VirtualTreeview(self.collection_tree, v_scrollbar)
         
         # Empaquetar
         self.collection_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -146,120 +195,337 @@ class CollectionView:
         row1_stats = ttk.Frame(stats_content)
         row1_stats.pack(fill=tk.X, pady=(0, 5))
         
-        self.total_cards_label = ttk.Label(row1_stats, text="Total cards: 0")
+        # Labels bound to variables: refreshing the statistics only sets the texts
+        self.total_cards_var = tk.StringVar(value="Total cards: 0")
+        self.total_cards_label = ttk.Label(row1_stats, textvariable=self.total_cards_var)
         self.total_cards_label.pack(side=tk.LEFT, padx=(0, 20))
         
-        self.unique_cards_label = ttk.Label(row1_stats, text="Unique cards: 0")
+        self.unique_cards_var = tk.StringVar(value="Unique cards: 0")
+        self.unique_cards_label = ttk.Label(row1_stats, textvariable=self.unique_cards_var)
         self.unique_cards_label.pack(side=tk.LEFT, padx=(0, 20))
         
-        self.total_value_label = ttk.Label(row1_stats, text="Total value: $0.00")
+        self.total_value_var = tk.StringVar(value="Total value: $0.00")
+        self.total_value_label = ttk.Label(row1_stats, textvariable=self.total_value_var)
         self.total_value_label.pack(side=tk.LEFT)
         
         # Segunda fila de estadísticas
         row2_stats = ttk.Frame(stats_content)
         row2_stats.pack(fill=tk.X)
         
-        self.by_rarity_label = ttk.Label(row2_stats, text="By rarity: Common: 0, Uncommon: 0, Rare: 0, Mythic: 0")
+        self.by_rarity_var = tk.StringVar(value="By rarity: Common: 0, Uncommon: 0, Rare: 0, Mythic: 0")
+        self.by_rarity_label = ttk.Label(row2_stats, textvariable=self.by_rarity_var)
         self.by_rarity_label.pack(side=tk.LEFT)
     
+    @property
+    def _collection_path(self) -> Path:
+        """File where the collection is stored"""
+        return Path(self.app_controller.get_settings().collection_file)
+    
+    def _set_status(self, message: str):
+        """Shows a message below the statistics and clears it after a while"""
+        if self._status_after_id:
+            self.frame.after_cancel(self._status_after_id)
+        self.status_var.set(message)
+        self._status_after_id = self.frame.after(_STATUS_CLEAR_MS, self._clear_status)
+    
+    def _clear_status(self):
+        """Removes the status message"""
+        self._status_after_id = None
+        self.status_var.set("")
+    
     def _load_collection(self):
         """Loads the collection from storage"""
         try:
-            # For now, empty collection
-            # TODO: Implement loading from file
-            self.collection_cards = {}
+            try:
+                with open(self._collection_path, 'rb') as file:
+                    stored = pickle.load(file)
+            except FileNotFoundError:
+                stored = {'qty': {}, 'info': {}}
+            
+            self.collection_cards = stored['qty']
+            # The stored card fields let the first display skip the database lookups
+            self._card_info_cache = dict(stored['info'])
+            self._rebuild_name_index()
+            self._recount_stats()
             self._update_collection_display()
         except Exception as e:
             self.logger.error(f"Error loading collection: {e}")
             messagebox.showerror("Error", f"Error loading collection: {e}")
     
+    def _save_collection(self):
+        """Stores the quantities and the resolved card fields in one binary file"""
+        collection_path = self._collection_path
+        temp_path = collection_path.with_suffix('.pkl.tmp')
+        info = {name: card_info for name, card_info in self._card_info_cache.items()
+                if card_info is not None and name in self.collection_cards}
+        try:
+            collection_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump({'qty': self.collection_cards, 'info': info}, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, collection_path)
+        except Exception as e:
+            self.logger.error(f"Error saving collection: {e}")
+    
+    @staticmethod
+    def _pack_card_info(card: Card) -> _CardInfo:
+        """Keeps only the fields the collection displays, instead of the whole card"""
+        rarity = card.rarity or ''
+        rarity_id = _RARITY_IDS.get(rarity.lower(), _OTHER_RARITY)
+        return (card.card_name, card.mana_cost or '', card.type_line or '', rarity, card.set_code or '', rarity_id)
+    
+    def _get_card_info(self, card_name: str) -> Optional[_CardInfo]:
+        """Gets the database fields for a collection name, searching only the first time"""
+        if card_name not in self._card_info_cache:
+            # Exact name first, like the batch lookup, so a single update shows the same card as a full refresh
+            self._load_card_info([card_name])
+        if card_name not in self._card_info_cache:
+            cards = self.app_controller.search_cards(card_name)
+            self._card_info_cache[card_name] = self._pack_card_info(cards[0]) if cards else None  # Take first match
+        return self._card_info_cache[card_name]
+    
+    def _load_card_info(self, card_names):
+        """Resolves the uncached names with one exact-name lookup; the rest are searched one by one later"""
+        missing = [name for name in card_names if name not in self._card_info_cache]
+        if missing:
+            found = self.app_controller.get_cards_by_names(missing)
+            self._card_info_cache.update((name, self._pack_card_info(card)) for name, card in found.items())
+    
+    def _collection_row(self, card_name: str, quantity: int) -> tuple:
+        """Builds the Treeview values of a collection entry"""
+        card_info = self._get_card_info(card_name)
+        if card_info is None:
+            # Card not found in database
+            return (quantity, card_name, "?", "?", "?", "?", "$0.00")
+        return (quantity, *card_info[:5], "$0.00")  # TODO: Implement prices
+    
     def _update_collection_display(self):
         """Updates the collection display"""
-        # Clear tree
-        for item in self.collection_tree.get_children():
-            self.collection_tree.delete(item)
+        self._display_filtered_collection(self.collection_cards)
+        self._update_stats()
+        # The whole collection is shown now, the next search has to filter again
+        self._last_search = None
+    
+    def _card_rarity(self, card_name: str) -> int:
+        """Rarity id of a collection card"""
+        card_info = self._get_card_info(card_name)
+        return card_info[5] if card_info is not None else _OTHER_RARITY
+    
+    def _set_quantity(self, card_name: str, quantity: int):
+        """Sets the quantity of a card (0 removes it), keeping the search index and the totals up to date"""
+        old_quantity = self.collection_cards.get(card_name, 0)
+        if quantity == old_quantity:
+            return
         
-        # Add collection cards
+        if quantity:
+            if not old_quantity:
+                self._index_name(card_name)
+            self.collection_cards[card_name] = quantity
+        else:
+            del self.collection_cards[card_name]
+            self._unindex_name(card_name)
+        
+        self._total_quantity += quantity - old_quantity
+        if old_quantity:
+            self._rarity_totals[self._counted_rarity.pop(card_name)] -= old_quantity
+        if quantity:
+            rarity = self._card_rarity(card_name)
+            self._rarity_totals[rarity] += quantity
+            self._counted_rarity[card_name] = rarity
+    
+    def _recount_stats(self):
+        """Computes the totals again after the whole collection was replaced"""
+        self._load_card_info(self.collection_cards)
+        card_rarity = self._card_rarity
+        rarity_totals = [0] * (_OTHER_RARITY + 1)
+        counted_rarity = {}
         for card_name, quantity in self.collection_cards.items():
-            # Search for card information
-            try:
-                cards = self.app_controller.search_cards(card_name)
-                if cards:
-                    card = cards[0]  # Take first match
-                    self.collection_tree.insert('', tk.END, values=(
-                        quantity,
-                        card.card_name,
-                        getattr(card, 'mana_cost', ''),
-                        getattr(card, 'type_line', ''),
-                        getattr(card, 'rarity', ''),
-                        getattr(card, 'set_code', ''),
-                        "$0.00"  # TODO: Implement prices
-                    ))
-                else:
-                    # Card not found in database
-                    self.collection_tree.insert('', tk.END, values=(
-                        quantity,
-                        card_name,
-                        "?", "?", "?", "?", "$0.00"
-                    ))
-            except Exception as e:
-                self.logger.error(f"Error getting card information {card_name}: {e}")
-        
-        self._update_stats()
+            rarity = card_rarity(card_name)
+            rarity_totals[rarity] += quantity
+            counted_rarity[card_name] = rarity
+        self._rarity_totals = rarity_totals
+        self._counted_rarity = counted_rarity
+        self._total_quantity = sum(self.collection_cards.values())
     
     def _update_stats(self):
         """Updates the collection statistics"""
-        total_cards = sum(self.collection_cards.values())
-        unique_cards = len(self.collection_cards)
+        common, uncommon, rare, mythic = self._rarity_totals[:_OTHER_RARITY]
         
-        self.total_cards_label.config(text=f"Total cards: {total_cards}")
-        self.unique_cards_label.config(text=f"Unique cards: {unique_cards}")
-        self.total_value_label.config(text="Total value: $0.00")  # TODO: Calcular valor real
-        self.by_rarity_label.config(text="By rarity: Common: 0, Uncommon: 0, Rare: 0, Mythic: 0")  # TODO: Calcular por rareza
+        self.total_cards_var.set(f"Total cards: {self._total_quantity}")
+        self.unique_cards_var.set(f"Unique cards: {len(self.collection_cards)}")
+        self.total_value_var.set("Total value: $0.00")  # TODO: Calcular valor real
+        self.by_rarity_var.set(
+            f"By rarity: Common: {common}, Uncommon: {uncommon}, Rare: {rare}, Mythic: {mythic}"
+        )
     
     def _on_search_changed(self, event=None):
         """Handles search changes"""
-        search_term = self.search_var.get().strip().lower()
+        # Restart the wait on every keystroke, so only the last one filters
+        if self._search_after_id:
+            self.frame.after_cancel(self._search_after_id)
+        self._search_after_id = self.frame.after(_SEARCH_DEBOUNCE_MS, self._do_search)
+    
+    def _do_search(self):
+        """Filters the collection with the current search term"""
+        if self._search_after_id:
+            self.frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
+        # Nothing to do if this search is the one already displayed (e.g. Search clicked after typing)
+        query = self._parse_search()
+        if query == self._last_search:
+            return
+        
+        search_term, prefix_only = query
         if not search_term:
             self._update_collection_display()
+            self._last_search = query
             return
         
-        # Filtrar cartas que coincidan con la búsqueda
+        # Filtrar cartas que coincidan con la búsqueda; longer terms only check the names sharing their trigrams
+        if prefix_only:
+            names = self._names_with_prefix(search_term)
+        elif len(search_term) >= 3:
+            names = self._search_candidates(search_term)
+        else:
+            names = self.collection_cards
         filtered_cards = {}
-        for card_name, quantity in self.collection_cards.items():
+        for card_name in names:
             if search_term in card_name.lower():
-                filtered_cards[card_name] = quantity
+                filtered_cards[card_name] = self.collection_cards[card_name]
         
         # Actualizar visualización con cartas filtradas
         self._display_filtered_collection(filtered_cards)
+        self._last_search = query
+    
+    def _parse_search(self) -> Tuple[str, bool]:
+        """Current search term, and whether it only matches name starts (short terms without a leading *)"""
+        search_term = self.search_var.get().strip().lower()
+        anywhere = search_term.startswith('*')
+        search_term = search_term.lstrip('*')
+        return search_term, len(search_term) < 3 and not anywhere
+    
+    def _index_name(self, card_name: str):
+        """Adds a collection name to the trigram index and the sorted names"""
+        name_lower = card_name.lower()
+        for gram in {name_lower[i:i + 3] for i in range(len(name_lower) - 2)}:
+            self._name_index.setdefault(gram, set()).add(card_name)
+        
+        position = bisect.bisect_right(self._sorted_lower_names, name_lower)
+        self._sorted_lower_names.insert(position, name_lower)
+        self._sorted_names.insert(position, card_name)
+    
+    def _unindex_name(self, card_name: str):
+        """Removes a collection name from the trigram index and the sorted names"""
+        name_lower = card_name.lower()
+        for gram in {name_lower[i:i + 3] for i in range(len(name_lower) - 2)}:
+            postings = self._name_index.get(gram)
+            if postings is not None:
+                postings.discard(card_name)
+                if not postings:
+                    del self._name_index[gram]
+        
+        # Names differing only in case share a lowercase key, look for the exact one among them
+        position = bisect.bisect_left(self._sorted_lower_names, name_lower)
+        while position < len(self._sorted_names) and self._sorted_lower_names[position] == name_lower:
+            if self._sorted_names[position] == card_name:
+                del self._sorted_lower_names[position]
+                del self._sorted_names[position]
+                break
+            position += 1
+    
+    def _rebuild_name_index(self):
+        """Indexes every name of the collection again"""
+        self._name_index = {}
+        for card_name in self.collection_cards:
+            name_lower = card_name.lower()
+            for gram in {name_lower[i:i + 3] for i in range(len(name_lower) - 2)}:
+                self._name_index.setdefault(gram, set()).add(card_name)
+        
+        pairs = sorted((card_name.lower(), card_name) for card_name in self.collection_cards)
+        self._sorted_lower_names = [name_lower for name_lower, _ in pairs]
+        self._sorted_names = [card_name for _, card_name in pairs]
+    
+    def _names_with_prefix(self, prefix: str) -> List[str]:
+        """Collection names starting with prefix (lowercase), sorted by name"""
+        start = bisect.bisect_left(self._sorted_lower_names, prefix)
+        end = bisect.bisect_left(self._sorted_lower_names, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        return self._sorted_names[start:end]
+    
+    def _search_candidates(self, term: str) -> List[str]:
+        """Collection names containing every trigram of the term, sorted by name"""
+        postings = []
+        for gram in {term[i:i + 3] for i in range(len(term) - 2)}:
+            names = self._name_index.get(gram)
+            if names is None:
+                return []
+            postings.append(names)
+        
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]), key=str.lower)
     
     def _display_filtered_collection(self, filtered_cards: Dict[str, int]):
         """Shows a filtered collection"""
-        # Limpiar árbol
-        for item in self.collection_tree.get_children():
-            self.collection_tree.delete(item)
-        
-        # Agregar cartas filtradas
+        try:
+            self._load_card_info(filtered_cards)
+        except Exception as e:
+            self.logger.error(f"Error getting card information: {e}")
+        
+        rows = []
+        row_names = []
+        # Bound once, this loop runs for every card shown
+        collection_row = self._collection_row
+        add_row = rows.append
+        add_name = row_names.append
         for card_name, quantity in filtered_cards.items():
             try:
-                cards = self.app_controller.search_cards(card_name)
-                if cards:
-                    card = cards[0]
-                    self.collection_tree.insert('', tk.END, values=(
-                        quantity,
-                        card.card_name,
-                        getattr(card, 'mana_cost', ''),
-                        getattr(card, 'type_line', ''),
-                        getattr(card, 'rarity', ''),
-                        getattr(card, 'set_code', ''),
-                        "$0.00"
-                    ))
+                add_row(collection_row(card_name, quantity))
+                add_name(card_name)
             except Exception as e:
-                self.logger.error(f"Error in filtered card {card_name}: {e}")
+                self.logger.error(f"Error getting card information {card_name}: {e}")
+        
+        self._rows = rows
+        self._row_names = row_names
+        self._row_positions = {card_name: position for position, card_name in enumerate(row_names)}
+        
+        # Only the rows in the viewport become tree items
+        self.virtual_tree.set_rows(rows)
+    
+    def _update_card_row(self, card_name: str):
+        """Applies the change of one card to the displayed rows instead of rebuilding all of them"""
+        position = self._row_positions.get(card_name)
+        quantity = self.collection_cards.get(card_name, 0)
+        search_term, prefix_only = self._parse_search()
+        name_lower = card_name.lower()
+        
+        try:
+            if position is not None and quantity:
+                self._rows[position] = self._collection_row(card_name, quantity)
+                self.virtual_tree.refresh()
+            elif position is not None:
+                del self._rows[position]
+                del self._row_names[position]
+                self._row_positions = {name: index for index, name in enumerate(self._row_names)}
+                self.virtual_tree.refresh(keep_selection=False)
+            elif quantity and (name_lower.startswith(search_term) if prefix_only else search_term in name_lower):
+                self._rows.append(self._collection_row(card_name, quantity))
+                self._row_names.append(card_name)
+                self._row_positions[card_name] = len(self._row_names) - 1
+                self.virtual_tree.refresh()
+        except Exception as e:
+            self.logger.error(f"Error getting card information {card_name}: {e}")
+        
+        self._update_stats()
+    
+    def _selected_card_name(self) -> Optional[str]:
+        """Collection name of the selected row, even if it is scrolled out of view"""
+        index = self.virtual_tree.selected_index()
+        if index is None or index >= len(self._row_names):
+            return None
+        return self._row_names[index]
     
     def _search_collection(self):
         """Performs search in the collection"""
-        self._on_search_changed()
+        self._do_search()
     
     def _add_card_to_collection(self):
         """Adds a card to the collection"""
@@ -289,19 +555,18 @@ class CollectionView:
             self.logger.error(f"Error verifying card: {e}")
         
         # Agregar a la colección
-        if card_name in self.collection_cards:
-            self.collection_cards[card_name] += quantity
-        else:
-            self.collection_cards[card_name] = quantity
+        self._card_info_cache.pop(card_name, None)
+        self._set_quantity(card_name, self.collection_cards.get(card_name, 0) + quantity)
         
         # Limpiar campos
         self.add_card_var.set("")
         self.quantity_var.set("1")
         
         # Actualizar visualización
-        self._update_collection_display()
+        self._update_card_row(card_name)
+        self._save_collection()
         
-        messagebox.showinfo("Success", f"Added {quantity}x {card_name} to collection")
+        self._set_status(f"Added {quantity}x {card_name} to collection")
     
     def _remove_card_from_collection(self):
         """Removes a card from the collection"""
@@ -324,27 +589,32 @@ class CollectionView:
             return
         
         # Quitar de la colección
+        self._card_info_cache.pop(card_name, None)
         current_quantity = self.collection_cards[card_name]
         if quantity >= current_quantity:
-            del self.collection_cards[card_name]
-            messagebox.showinfo("Success", f"Completely removed {card_name} from collection")
+            self._set_quantity(card_name, 0)
+            self._set_status(f"Completely removed {card_name} from collection")
         else:
-            self.collection_cards[card_name] -= quantity
-            messagebox.showinfo("Success", f"Removed {quantity}x {card_name} from collection")
+            self._set_quantity(card_name, current_quantity - quantity)
+            self._set_status(f"Removed {quantity}x {card_name} from collection")
         
         # Limpiar campos
         self.add_card_var.set("")
         self.quantity_var.set("1")
         
         # Actualizar visualización
-        self._update_collection_display()
+        self._update_card_row(card_name)
+        self._save_collection()
     
     def _on_card_selected(self, event=None):
         """Handles card selection"""
-        selection = self.collection_tree.selection()
-        if selection:
-            item = self.collection_tree.item(selection[0])
-            card_name = item['values'][1]
+        # Selection moves made by the virtual tree while scrolling are not the user's
+        if self.virtual_tree.updating_selection or not self.collection_tree.selection():
+            return
+        
+        # Tree items are reused while scrolling, the virtual tree knows which row is selected
+        card_name = self._selected_card_name()
+        if card_name:
             self.add_card_var.set(card_name)
     
     def _on_card_double_click(self, event=None):
@@ -353,14 +623,12 @@ class CollectionView:
     
     def _edit_quantity(self):
         """Edits the quantity of a selected card"""
-        selection = self.collection_tree.selection()
-        if not selection:
+        card_name = self._selected_card_name()
+        if not card_name:
             messagebox.showwarning("Warning", "Select a card")
             return
         
-        item = self.collection_tree.item(selection[0])
-        card_name = item['values'][1]
-        current_quantity = item['values'][0]
+        current_quantity = self.collection_cards[card_name]
         
         # Dialog for new quantity
         new_quantity = tk.simpledialog.askinteger(
@@ -372,12 +640,11 @@ class CollectionView:
         )
         
         if new_quantity is not None:
-            if new_quantity == 0:
-                del self.collection_cards[card_name]
-            else:
-                self.collection_cards[card_name] = new_quantity
+            self._card_info_cache.pop(card_name, None)
+            self._set_quantity(card_name, new_quantity)
             
-            self._update_collection_display()
+            self._update_card_row(card_name)
+            self._save_collection()
     
     def _view_card_details(self):
         """Shows details of the selected card"""
@@ -385,18 +652,17 @@ class CollectionView:
     
     def _remove_selected_card(self):
         """Removes the selected card from the collection"""
-        selection = self.collection_tree.selection()
-        if not selection:
+        card_name = self._selected_card_name()
+        if not card_name:
             messagebox.showwarning("Warning", "Select a card")
             return
         
-        item = self.collection_tree.item(selection[0])
-        card_name = item['values'][1]
-        
         result = messagebox.askyesno("Confirm", f"Remove {card_name} from collection?")
         if result:
-            del self.collection_cards[card_name]
-            self._update_collection_display()
+            self._card_info_cache.pop(card_name, None)
+            self._set_quantity(card_name, 0)
+            self._update_card_row(card_name)
+            self._save_collection()
     
     def _import_collection(self):
         """Imports a collection from file"""
@@ -405,9 +671,70 @@ class CollectionView:
             filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
-        if file_path:
-            # TODO: Implementar importación
-            messagebox.showinfo("Info", "Function under development: Import collection")
+        if not file_path:
+            return
+        
+        try:
+            if file_path.lower().endswith('.csv'):
+                imported = self._read_collection_csv(file_path)
+            else:
+                imported = self._read_collection_txt(file_path)
+        except Exception as e:
+            self.logger.error(f"Error importing collection: {e}")
+            messagebox.showerror("Error", f"Error importing collection: {e}")
+            return
+        
+        # The whole file is merged first so the view is rebuilt and saved only once
+        merged = dict(self.collection_cards)
+        for card_name, quantity in imported.items():
+            merged[card_name] = merged.get(card_name, 0) + quantity
+        self.set_collection(merged)
+        
+        self._set_status(f"Imported {sum(imported.values())} cards ({len(imported)} unique)")
+    
+    def _read_collection_txt(self, file_path: str) -> Dict[str, int]:
+        """Reads a text collection with one "N Name" line per card; lines without quantity count once"""
+        imported: Dict[str, int] = {}
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith(('#', '//')):
+                    continue
+                match = _COLLECTION_LINE.match(line)
+                card_name, quantity = (match.group(2), int(match.group(1))) if match else (line, 1)
+                if quantity > 0:
+                    imported[card_name] = imported.get(card_name, 0) + quantity
+        return imported
+    
+    def _read_collection_csv(self, file_path: str) -> Dict[str, int]:
+        """Reads a CSV collection with quantity and name columns (comma or semicolon separated)"""
+        imported: Dict[str, int] = {}
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            first_line = file.readline()
+            delimiter = ';' if first_line.count(';') > first_line.count(',') else ','
+            file.seek(0)
+            reader = csv.reader(file, delimiter=delimiter)
+            
+            # With a header the columns are found by name, otherwise they are quantity, name
+            header = [column.strip().lower() for column in next(reader, [])]
+            if 'quantity' in header and ('card_name' in header or 'name' in header):
+                quantity_column = header.index('quantity')
+                name_column = header.index('card_name' if 'card_name' in header else 'name')
+            else:
+                quantity_column, name_column = 0, 1
+                file.seek(0)
+                reader = csv.reader(file, delimiter=delimiter)
+            
+            for row in reader:
+                try:
+                    quantity = int(row[quantity_column])
+                    card_name = row[name_column].strip()
+                except (IndexError, ValueError):
+                    self.logger.warning(f"Skipping invalid collection row: {row}")
+                    continue
+                if card_name and quantity > 0:
+                    imported[card_name] = imported.get(card_name, 0) + quantity
+        return imported
     
     def _export_collection(self):
         """Exports the collection to file"""
@@ -421,9 +748,28 @@ class CollectionView:
             filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
-        if file_path:
-            # TODO: Implementar exportación
-            messagebox.showinfo("Info", "Function under development: Export collection")
+        if not file_path:
+            return
+        
+        # The whole file is built in memory and written with a single call
+        if file_path.lower().endswith('.csv'):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerow(('quantity', 'card_name'))
+            writer.writerows((quantity, card_name) for card_name, quantity in self.collection_cards.items())
+            content = buffer.getvalue()
+        else:
+            content = ''.join([f"{quantity} {card_name}\n" for card_name, quantity in self.collection_cards.items()])
+        
+        try:
+            with open(file_path, 'w', newline='', encoding='utf-8') as file:
+                file.write(content)
+        except Exception as e:
+            self.logger.error(f"Error exporting collection: {e}")
+            messagebox.showerror("Error", f"Error exporting collection: {e}")
+            return
+        
+        self._set_status(f"Collection exported to {file_path}")
     
     def _clear_collection(self):
         """Clears the entire collection"""
@@ -434,12 +780,19 @@ class CollectionView:
         result = messagebox.askyesno("Confirm", "Are you sure you want to clear the entire collection?")
         if result:
             self.collection_cards.clear()
+            self._rebuild_name_index()
+            self._card_info_cache.clear()
+            self._recount_stats()
             self._update_collection_display()
-            messagebox.showinfo("Success", "Collection cleared")
+            self._save_collection()
+            self._set_status("Collection cleared")
     
     def show(self):
-        """Shows the view"""
-        if self.frame:
+        """Shows the view, building it the first time"""
+        if self.frame is None:
+            self._create_interface()
+            self._load_collection()
+        else:
             self.frame.pack(fill=tk.BOTH, expand=True)
     
     def hide(self):
@@ -449,7 +802,8 @@ class CollectionView:
     
     def refresh(self):
         """Refreshes the view"""
-        self._update_collection_display()
+        if self.frame is not None:
+            self._update_collection_display()
     
     def get_collection(self) -> Dict[str, int]:
         """Gets the current collection"""
@@ -458,4 +812,9 @@ class CollectionView:
     def set_collection(self, collection: Dict[str, int]):
         """Sets the collection"""
         self.collection_cards = collection.copy()
-        self._update_collection_display()
\ No newline at end of file
+        self._rebuild_name_index()
+        self._card_info_cache.clear()
+        self._recount_stats()
+        if self.frame is not None:
+            self._update_collection_display()
+        self._save_collection()
\ No newline at end of file
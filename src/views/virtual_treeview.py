@@ -0,0 +1,186 @@
+"""Treeview that only materializes the visible rows"""
+
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from typing import List, Optional, Sequence, Tuple
+
+# Lines scrolled per mouse wheel step
+_WHEEL_LINES = 3
+
+
+class VirtualTreeview:
+    """Shows a long list of rows in a Treeview by reusing one item per visible line"""
+    
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows: Sequence[tuple] = []
+        self.first = 0
+        self._viewport = max(1, int(tree.cget('height')))
+        self._slots: List[str] = []
+        self._selected: Optional[int] = None
+        # True while <<TreeviewSelect>> events queued by the widget's own selection changes are pending
+        self.updating_selection = False
+        
+        # The tree never scrolls itself, the scrollbar drives the window over the rows
+        tree.configure(yscrollcommand='')
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', self._on_mousewheel)
+        tree.bind('<Button-5>', self._on_mousewheel)
+        tree.bind('<Up>', lambda event: self._move_selection(-1))
+        tree.bind('<Down>', lambda event: self._move_selection(1))
+        tree.bind('<Prior>', lambda event: self._move_selection(-self._viewport))
+        tree.bind('<Next>', lambda event: self._move_selection(self._viewport))
+        tree.bind('<Configure>', self._on_configure)
+    
+    def set_rows(self, rows: Sequence[tuple]):
+        """Replaces the rows, showing the list from the top"""
+        self.rows = rows
+        self.first = 0
+        self._selected = None
+        self._render()
+    
+    def refresh(self, keep_selection: bool = True):
+        """Shows the rows again after they were changed in place, keeping the scroll position"""
+        selected = self.selected_index() if keep_selection else None
+        self._selected = selected if selected is not None and selected < len(self.rows) else None
+        self.first = max(0, min(self.first, len(self.rows) - self._viewport))
+        self._render()
+    
+    def selected_index(self) -> Optional[int]:
+        """Position in rows of the selected line, even if it is scrolled out of view"""
+        selection = self.tree.selection()
+        if selection and selection[0] in self._slots:
+            return self.first + self._slots.index(selection[0])
+        return self._selected
+    
+    def scroll_to(self, first: int):
+        """Shows the rows starting at the given position"""
+        first = max(0, min(first, len(self.rows) - self._viewport))
+        if first != self.first:
+            self._selected = self.selected_index()
+            self._move_window(first)
+            self._render()
+    
+    def _move_window(self, first: int):
+        """Moves the window to first, rotating the items so rows still in view keep their item"""
+        shift = first - self.first
+        if 0 < abs(shift) < len(self._slots):
+            # The rows that stay visible keep their item (and its selection), only the others are refilled
+            if shift > 0:
+                moved = self._slots[:shift]
+                self._slots = self._slots[shift:] + moved
+                for slot in moved:
+                    self.tree.move(slot, '', tk.END)
+            else:
+                moved = self._slots[shift:]
+                self._slots = moved + self._slots[:shift]
+                for position, slot in enumerate(moved):
+                    self.tree.move(slot, '', position)
+        self.first = first
+    
+    def _render(self, user_selection: bool = False):
+        """Updates the reused items with the rows in the window"""
+        count = max(0, min(self._viewport, len(self.rows) - self.first))
+        
+        # Items are only created or deleted when the number of visible lines changes
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert('', tk.END))
+        if len(self._slots) > count:
+            self.tree.delete(*self._slots[count:])
+            del self._slots[count:]
+        
+        # Straight to the Tcl command: ttk's item() re-formats its options in Python on every call
+        call = self.tree.tk.call
+        widget = self.tree._w
+        for slot, values in zip(self._slots, self.rows[self.first:self.first + count]):
+            call(widget, 'item', slot, '-values', values)
+        
+        total = len(self.rows)
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+        
+        # Keep the selection on its row: the Tk selection only changes when that row enters or leaves the window
+        if self._selected is not None and self.first <= self._selected < self.first + count:
+            slot = self._slots[self._selected - self.first]
+            if self.tree.selection() != (slot,):
+                self._set_selection(slot, user_selection)
+            self.tree.focus(slot)
+        elif self.tree.selection():
+            self._set_selection((), user_selection)
+    
+    def _set_selection(self, items, user_selection: bool):
+        """Changes the Tk selection, flagging the events it queues unless the user asked for it"""
+        if not user_selection:
+            # <<TreeviewSelect>> is queued, so the flag is cleared once the pending events were handled
+            self.updating_selection = True
+            self.tree.after_idle(self._end_selection_update)
+        self.tree.selection_set(items)
+    
+    def _end_selection_update(self):
+        """Lets selection handlers react again after the widget's own selection changes"""
+        self.updating_selection = False
+    
+    def _on_scrollbar(self, *args):
+        """Handles the scrollbar commands (moveto fraction / scroll n units|pages)"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self._viewport if args[2] == 'pages' else 1)
+            self.scroll_to(self.first + step)
+    
+    def _on_mousewheel(self, event):
+        """Scrolls with the mouse wheel (delta on Windows/macOS, buttons 4/5 on X11)"""
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.first - _WHEEL_LINES)
+        else:
+            self.scroll_to(self.first + _WHEEL_LINES)
+        return 'break'
+    
+    def _move_selection(self, step: int):
+        """Moves the selection with the keyboard, scrolling when it leaves the window"""
+        if not self.rows:
+            return 'break'
+        index = self.selected_index()
+        index = 0 if index is None else max(0, min(len(self.rows) - 1, index + step))
+        
+        if index < self.first:
+            self._move_window(index)
+        elif index >= self.first + self._viewport:
+            self._move_window(index - self._viewport + 1)
+        self._selected = index
+        # A keyboard move is a real selection change, its event is not flagged
+        self._render(user_selection=True)
+        return 'break'
+    
+    def _row_metrics(self) -> Tuple[int, int]:
+        """Header height and row height, measured on the first line when one is shown"""
+        bbox = self.tree.bbox(self._slots[0]) if self._slots else None
+        if bbox:
+            # bbox gives the header height (y) and the row height (height) of the first line
+            return bbox[1], bbox[3]
+        
+        # No line to measure yet (e.g. rows still loading): the style's rowheight or the font's linespace
+        style = self.tree.cget('style') or 'Treeview'
+        try:
+            row_height = int(ttk.Style(self.tree).lookup(style, 'rowheight'))
+        except (ValueError, tk.TclError):
+            font = ttk.Style(self.tree).lookup(style, 'font') or 'TkDefaultFont'
+            row_height = tkfont.Font(root=self.tree, font=font).metrics('linespace')
+        row_height = max(1, row_height)
+        header_height = row_height if 'headings' in str(self.tree.cget('show')) else 0
+        return header_height, row_height
+    
+    def _on_configure(self, event):
+        """Adapts the number of reused items to the height of the widget"""
+        header_height, row_height = self._row_metrics()
+        viewport = max(1, (event.height - header_height) // row_height)
+        if viewport != self._viewport:
+            self._selected = self.selected_index()
+            self._viewport = viewport
+            self.first = max(0, min(self.first, len(self.rows) - viewport))
+            self._render()
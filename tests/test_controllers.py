@@ -349,6 +349,17 @@ class TestDeckController(unittest.TestCase):
         
         self.assertTrue(result)
         self.mock_deck_service.delete_deck.assert_called_once_with('deck_to_delete.json')
+    
+    def test_compare_with_collection(self):
+        """Test comparison uses the service's own name index"""
+        self.deck_controller.current_deck = self.test_deck
+        self.mock_deck_service.compare_with_collection.return_value = {'total_needed': 4}
+        
+        result = self.deck_controller.compare_with_collection()
+        
+        self.assertEqual(result, {'total_needed': 4})
+        self.mock_deck_service.compare_with_collection.assert_called_once_with(self.test_deck)
+        self.mock_card_service.load_cards.assert_not_called()
 
 
 if __name__ == '__main__':
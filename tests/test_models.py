@@ -52,12 +52,53 @@ class TestCard(unittest.TestCase):
         creature = Card(**creature_data)
         self.assertTrue(creature.is_creature)
     
+    def test_card_from_scryfall_brief(self):
+        """Test building a card from a Scryfall object keeps the displayed fields"""
+        card = Card.from_scryfall_brief({
+            'id': 'uuid-1',
+            'name': 'Delver of Secrets // Insectile Aberration',
+            'type_line': 'Creature — Human Wizard // Creature — Human Insect',
+            'rarity': 'common',
+            'set': 'isd',
+            'color_identity': ['U'],
+            'prices': {'usd': '0.10'},
+            'card_faces': [{'mana_cost': '{U}', 'colors': ['U'], 'image_uris': {'normal': 'front.jpg'}}]
+        })
+        
+        self.assertEqual(card.scryfall_uuid, 'uuid-1')
+        self.assertEqual(card.mana_cost, '{U}')
+        self.assertEqual(card.colors, ['U'])
+        self.assertEqual(card.set_code, 'isd')
+        self.assertEqual(card.image_url, 'front.jpg')
+        self.assertTrue(card.is_creature)
+    
+    def test_card_main_type_tokens(self):
+        """Test main type tokens are taken from the type line"""
+        self.assertEqual(Card(**self.card_data).main_type_tokens, ('Instant',))
+        card = Card(card_name='Llanowar Elves', type_line='Legendary Creature — Elf Druid')
+        self.assertEqual(card.main_type_tokens, ('Legendary', 'Creature'))
+        self.assertEqual(Card(card_name='Unknown').main_type_tokens, ())
+    
+    def test_card_uses_slots(self):
+        """Test cards are slotted and reject unknown attributes"""
+        card = Card(**self.card_data)
+        self.assertFalse(hasattr(card, '__dict__'))
+        with self.assertRaises(AttributeError):
+            card.unknown_attribute = 1
+    
     def test_card_colors(self):
         """Test color handling"""
         card = Card(**self.card_data)
         self.assertEqual(card.colors, ['R'])
         self.assertIn('R', card.colors)
         self.assertNotIn('U', card.colors)
+        
+        # Color lists stored as text are parsed into codes
+        raw_data = self.card_data.copy()
+        raw_data.update({'colors': "['R', 'G']", 'color_identity': "[]"})
+        raw_card = Card(**raw_data)
+        self.assertEqual(raw_card.colors, ['R', 'G'])
+        self.assertEqual(raw_card.color_identity, [])
     
     def test_card_multicolor(self):
         """Test multicolor card"""
@@ -76,6 +117,19 @@ class TestCard(unittest.TestCase):
         self.assertEqual(card.display_name, 'Lightning Bolt')
         self.assertIn('Lightning Bolt', str(card))
 
+    def test_card_equality_and_hash(self):
+        """Test cards are identified by UUID, falling back to name"""
+        card = Card(scryfall_uuid='uuid-1', **self.card_data)
+        same_uuid = Card(scryfall_uuid='uuid-1', **self.card_data)
+        other_uuid = Card(scryfall_uuid='uuid-2', **self.card_data)
+        self.assertEqual(card, same_uuid)
+        self.assertNotEqual(card, other_uuid)
+        self.assertEqual(len({card, same_uuid, other_uuid}), 2)
+
+        # Without UUID the name is used
+        self.assertEqual(Card(card_name='Counterspell'), Card(card_name='Counterspell'))
+        self.assertEqual(len({Card(card_name='Counterspell'), Card(card_name='Counterspell')}), 1)
+
 
 class TestDeck(unittest.TestCase):
     """Tests for Deck model"""
@@ -147,6 +201,16 @@ class TestDeck(unittest.TestCase):
         # Verify that curve contains added cards
         self.assertGreater(sum(curve.values()), 0)
     
+    def test_distributions_single_pass(self):
+        """Test combined distributions match the individual properties"""
+        self.deck.add_card(self.lightning_bolt, 4)
+        self.deck.add_card(self.counterspell, 2)
+        
+        colors, curve, types = self.deck.distributions()
+        self.assertEqual(colors, self.deck.color_distribution)
+        self.assertEqual(curve, {1: 4, 2: 2})
+        self.assertEqual(types, self.deck.type_distribution)
+    
     def test_deck_validation(self):
         """Test deck validation"""
         # Empty deck is not valid for formats that require minimum cards
@@ -3,6 +3,9 @@ import sys
 import os
 import tempfile
 import shutil
+import json
+import time
+import requests
 from unittest.mock import Mock, patch, mock_open
 import pandas as pd
 
@@ -13,6 +16,7 @@ try:
     from services.card_service import CardService
     from services.deck_service import DeckService
     from services.image_service import ImageService
+    from services.scryfall_service import ScryfallService
     from models.card import Card
     from models.deck import Deck
 except ImportError:
@@ -23,6 +27,7 @@ except ImportError:
     from src.services.card_service import CardService
     from src.services.deck_service import DeckService
     from src.services.image_service import ImageService
+    from src.services.scryfall_service import ScryfallService
     from src.models.card import Card
     from src.models.deck import Deck
 
@@ -74,6 +79,56 @@ class TestCardService(unittest.TestCase):
         self.assertIn('Lightning Bolt', card_names)
         self.assertIn('Counterspell', card_names)
     
+    def test_load_cards_from_csv(self):
+        """Test parsing the semicolon separated collection file"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            csv_path = os.path.join(test_dir, 'cards.csv')
+            with open(csv_path, 'w', encoding='utf-8') as f:
+                f.write("scryfall_uuid;set_code;quantity;card_name;english_card_name\n")
+                f.write("uuid-1;lea;4;Rayo;Lightning Bolt\n")
+                f.write("uuid-2;lea;1;Counterspell\n")
+            
+            cards = CardService(csv_path).load_cards()
+            
+            self.assertEqual(len(cards), 2)
+            self.assertEqual(cards[0].english_card_name, 'Lightning Bolt')
+            self.assertEqual(cards[0].quantity, 4)
+            self.assertEqual(cards[0].scryfall_uuid, 'uuid-1')
+            self.assertIsNone(cards[0].mana_cost)
+            self.assertIsNone(cards[1].english_card_name)
+            
+            # A second load is served from the parsed-rows cache
+            with patch.object(CardService, '_read_rows_from_csv') as mock_parse:
+                cached_cards = CardService(csv_path).load_cards()
+                mock_parse.assert_not_called()
+            self.assertEqual([card.card_name for card in cached_cards], ['Rayo', 'Counterspell'])
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+    
+    def test_name_index_reloads_changed_file(self):
+        """Test the name index is rebuilt when the CSV changes on disk"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            csv_path = os.path.join(test_dir, 'cards.csv')
+            with open(csv_path, 'w', encoding='utf-8') as f:
+                f.write("card_name;quantity\nCounterspell;1\n")
+            
+            service = CardService(csv_path)
+            self.assertEqual(list(service.get_name_index()), ['counterspell'])
+            
+            with open(csv_path, 'a', encoding='utf-8') as f:
+                f.write("Lightning Bolt;4\n")
+            self.assertIn('lightning bolt', service.get_name_index())
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+    
+    def test_find_cards_by_names(self):
+        """Test bulk lookup by name"""
+        found = self.card_service.find_cards_by_names(['LIGHTNING BOLT', 'Nonexistent'])
+        self.assertEqual(found['LIGHTNING BOLT'].card_name, 'Lightning Bolt')
+        self.assertIsNone(found['Nonexistent'])
+    
     def test_search_cards_by_name(self):
         """Test search by name"""
         # First load the cards
@@ -91,6 +146,16 @@ class TestCardService(unittest.TestCase):
         results = self.card_service.search_cards('Nonexistent')
         self.assertEqual(len(results), 0)
     
+    def test_search_cards_uses_trigram_index(self):
+        """Test substring search through the trigram index matches the plain scan"""
+        self.card_service.load_cards()
+        
+        self.assertEqual([card.card_name for card in self.card_service.search_cards('ng bo')], ['Lightning Bolt'])
+        self.assertEqual([card.card_name for card in self.card_service.search_cards('SPELL')], ['Counterspell'])
+        self.assertEqual(self.card_service.search_cards('boltz'), [])
+        # Short queries fall back to scanning every card
+        self.assertEqual(len(self.card_service.search_cards('n')), 2)
+    
     def test_search_cards_by_color(self):
         """Test search by color"""
         # First load the cards
@@ -134,6 +199,68 @@ class TestCardService(unittest.TestCase):
         card = self.card_service.find_card_by_name('Nonexistent')
         self.assertIsNone(card)
     
+    def test_find_cards_by_prefix(self):
+        """Test prefix lookup for autocomplete"""
+        results = self.card_service.find_cards_by_prefix('light')
+        self.assertEqual([card.card_name for card in results], ['Lightning Bolt'])
+        
+        results = self.card_service.find_cards_by_prefix('')
+        self.assertEqual([card.card_name for card in results], ['Counterspell', 'Lightning Bolt'])
+        
+        self.assertEqual(self.card_service.find_cards_by_prefix('bolt'), [])
+    
+    def test_precomputed_filters(self):
+        """Test rarity/set filters and available sets served from the index"""
+        self.assertEqual(len(self.card_service.get_cards_by_rarity('COMMON')), 2)
+        self.assertEqual(len(self.card_service.get_cards_by_set('lea')), 2)
+        self.assertEqual(self.card_service.get_cards_by_set('M21'), [])
+        self.assertEqual(self.card_service.get_available_sets(), ['LEA'])
+        self.assertEqual(self.card_service.get_available_types(), ['Instant'])
+    
+    def test_inverted_color_and_type_indexes(self):
+        """Test color/type lookups served from the inverted indexes"""
+        results = self.card_service.get_cards_by_color(['R', 'U', 'R'])
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(self.card_service.get_cards_by_type('instant')), 2)
+        # Partial words still match inside type words
+        self.assertEqual(len(self.card_service.get_cards_by_type('Inst')), 2)
+        self.assertEqual(self.card_service.get_cards_by_type('Creature'), [])
+        
+        # Substring matches and collection order are kept
+        werewolf = Card(card_name='Werewolf Pack', type_line='Creature — Werewolf', colors=['G'], color_identity=['G'])
+        self.card_service._cards_cache.insert(0, werewolf)
+        self.card_service.refresh_indexes()
+        self.assertEqual(self.card_service.get_cards_by_type('wolf'), [werewolf])
+        self.assertEqual(self.card_service.get_cards_by_type('ure — wer'), [werewolf])
+        self.assertEqual([card.card_name for card in self.card_service.get_cards_by_color(['U', 'G', 'R'])],
+                         ['Werewolf Pack', 'Lightning Bolt', 'Counterspell'])
+    
+    def test_query_combines_filters(self):
+        """Test combined filters in a single query"""
+        results = self.card_service.query(colors=['R'], card_type='instant', rarity='common')
+        self.assertEqual([card.card_name for card in results], ['Lightning Bolt'])
+        self.assertEqual(self.card_service.query(colors=['U'], set_code='M21'), [])
+        self.assertEqual(len(self.card_service.query()), len(self.card_service.cards))
+    
+    def test_statistics_are_returned_as_copies(self):
+        """Test changing the returned statistics leaves the service's totals intact"""
+        stats = self.card_service.get_statistics()
+        stats['total_quantity'] = -1
+        stats['color_distribution']['R'] = -1
+        
+        fresh = self.card_service.get_statistics()
+        self.assertNotEqual(fresh['total_quantity'], -1)
+        self.assertNotEqual(fresh['color_distribution']['R'], -1)
+    
+    def test_set_card_quantity_adjusts_statistics(self):
+        """Test a quantity change updates the totals like a full rebuild would"""
+        card = self.card_service.find_card_by_name('Lightning Bolt')
+        self.card_service.set_card_quantity(card, card.quantity + 3)
+        adjusted = self.card_service.get_statistics()
+        
+        self.card_service.refresh_indexes()
+        self.assertEqual(adjusted, self.card_service.get_statistics())
+    
     def test_get_statistics(self):
         """Test get card statistics"""
         # First load the cards
@@ -171,27 +298,21 @@ class TestDeckService(unittest.TestCase):
         """Cleanup after each test"""
         shutil.rmtree(self.test_dir, ignore_errors=True)
     
-    @patch('os.makedirs')
-    @patch('builtins.open', new_callable=unittest.mock.mock_open)
-    @patch('json.dump')
-    def test_save_deck(self, mock_json_dump, mock_open, mock_makedirs):
+    def test_save_deck(self):
         """Test save deck"""
         result = self.deck_service.save_deck(self.test_deck)
         
         self.assertTrue(result)
-        mock_open.assert_called_once()
-        mock_json_dump.assert_called_once()
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Test-Deck.json')))
     
-    @patch('os.path.exists', return_value=True)
-    @patch('builtins.open', new_callable=unittest.mock.mock_open, read_data='{"name": "Test Deck", "cards": {}}')
-    @patch('json.load', return_value={'name': 'Test Deck', 'cards': {}})
-    def test_load_deck(self, mock_json_load, mock_open, mock_exists):
+    def test_load_deck(self):
         """Test load deck"""
-        deck = self.deck_service.load_deck('test_deck.json')
+        self.deck_service.save_deck(self.test_deck)
+        deck = self.deck_service.load_deck('Test-Deck.json')
         
         self.assertIsNotNone(deck)
         self.assertEqual(deck.name, 'Test Deck')
-        mock_open.assert_called_once()
+        self.assertEqual(deck.total_cards, 4)
     
     @patch('os.path.exists', return_value=False)
     def test_load_nonexistent_deck(self, mock_exists):
@@ -210,6 +331,36 @@ class TestDeckService(unittest.TestCase):
         self.assertIn('deck2.json', decks)
         self.assertNotIn('not_a_deck.txt', decks)
     
+    def test_list_decks_uses_index(self):
+        """Test unchanged decks are listed from the metadata index"""
+        self.deck_service.save_deck(self.test_deck)
+        self.assertEqual(self.deck_service.list_decks()[0]['card_count'], 1)
+        
+        # An unchanged deck is not parsed again: garble it keeping size and mtime
+        deck_path = os.path.join(self.test_dir, 'Test-Deck.json')
+        stat = os.stat(deck_path)
+        with open(deck_path, 'wb') as f:
+            f.write(b'x' * stat.st_size)
+        os.utime(deck_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        decks = self.deck_service.list_decks()
+        self.assertEqual([deck['name'] for deck in decks], ['Test Deck'])
+        
+        # A modified deck is parsed again
+        self.test_deck.add_card(Card(card_name='Counterspell', type_line='Instant'), 2)
+        self.deck_service.save_deck(self.test_deck)
+        self.assertEqual(self.deck_service.list_decks()[0]['card_count'], 2)
+    
+    def test_save_and_delete_update_index(self):
+        """Test saving and deleting keep the deck index current"""
+        self.deck_service.save_deck(self.test_deck)
+        with patch.object(self.deck_service, '_read_deck_meta') as mock_read:
+            decks = self.deck_service.list_decks()
+        mock_read.assert_not_called()
+        self.assertEqual([deck['name'] for deck in decks], ['Test Deck'])
+        
+        self.assertTrue(self.deck_service.delete_deck('Test-Deck.json'))
+        self.assertEqual(self.deck_service._read_deck_index(), {})
+    
     def test_analyze_deck(self):
         """Test deck analysis"""
         # Analyze test deck
@@ -222,6 +373,31 @@ class TestDeckService(unittest.TestCase):
         # Verificar que el total de cartas es correcto
         self.assertEqual(result['total_cards'], 4)
     
+    def test_analyze_deck_type_counts(self):
+        """Test type counts include multi-type cards in each type"""
+        self.test_deck.add_card(Card(card_name='Ornithopter', type_line='Artifact Creature — Thopter'), 2)
+        result = self.deck_service.analyze_deck(self.test_deck)
+        
+        self.assertEqual(result['instants'], 1)
+        self.assertEqual(result['creatures'], 1)
+        self.assertEqual(result['artifacts'], 1)
+        self.assertEqual(result['lands'], 0)
+    
+    def test_compare_with_collection(self):
+        """Test deck comparison against the collection name index"""
+        self.test_deck.add_card(Card(card_name='Counterspell', type_line='Instant'), 2)
+        owned = Card(card_name='Lightning Bolt', quantity=3)
+        self.mock_card_service.get_name_index.return_value = {'lightning bolt': owned}
+        
+        result = self.deck_service.compare_with_collection(self.test_deck)
+        
+        self.assertEqual(len(result['partial_cards']), 1)
+        self.assertEqual(len(result['missing_cards']), 1)
+        self.assertEqual(result['total_cards_needed'], 6)
+        self.assertEqual(result['total_cards_available'], 3)
+        self.assertEqual(result['total_cards_missing'], 3)
+        self.assertEqual(result['completion_percentage'], 50.0)
+    
     def test_export_deck_to_txt(self):
         """Test export deck to text"""
         # Create temporary file
@@ -243,6 +419,49 @@ class TestDeckService(unittest.TestCase):
             # Clean up temporary file
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+    
+    def test_export_deck_to_txt_sections(self):
+        """Test multi-type cards are listed in every matching section"""
+        self.test_deck.add_card(Card(card_name='Ornithopter', type_line='Artifact Creature — Thopter'), 2)
+        self.test_deck.add_card(Card(card_name='Mystery'), 1)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            self.assertTrue(self.deck_service.export_deck_to_txt(self.test_deck, temp_path))
+            with open(temp_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self.assertIn('// Creatures\n2x Ornithopter\n', content)
+            self.assertIn('// Instants\n4x Lightning Bolt\n', content)
+            self.assertIn('// Artifacts\n2x Ornithopter\n', content)
+            self.assertIn('// Others\n1x Mystery\n', content)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+    
+    def test_import_deck_from_txt(self):
+        """Test import deck from a text list"""
+        counterspell = Card(card_name='Counterspell', type_line='Instant')
+        index = {'lightning bolt': self.test_card, 'counterspell': counterspell}
+        self.mock_card_service.find_cards_by_names.side_effect = \
+            lambda names: {name: index.get(name.lower()) for name in names}
+        
+        deck_path = os.path.join(self.test_dir, 'deck.txt')
+        with open(deck_path, 'w', encoding='utf-8') as f:
+            f.write("// Instants\n3x Lightning Bolt\n2 counterspell  \n\n1X\tLightning Bolt\n4 Unknown Card\nSideboard\n")
+        
+        deck = self.deck_service.import_deck_from_txt(deck_path, 'Imported')
+        
+        self.assertEqual(deck.name, 'Imported')
+        self.assertEqual(deck.find_card('Lightning Bolt').quantity, 4)
+        self.assertEqual(deck.find_card('Counterspell').quantity, 2)
+        self.assertEqual(deck.total_cards, 6)
+    
+    def test_safe_filename(self):
+        """Test deck names are converted to safe filenames"""
+        self.assertEqual(self.deck_service._safe_filename('Mono Red: Burn!'), 'Mono-Red_-Burn_')
+        self.assertEqual(self.deck_service._safe_filename('  Dragón   Ñu '), 'Dragón-Ñu')
 
 
 class TestImageService(unittest.TestCase):
@@ -277,6 +496,36 @@ class TestImageService(unittest.TestCase):
                 self.assertIsNotNone(result)
                 mock_get.assert_called_once()
     
+    def test_photo_cache_reuses_images(self):
+        """Test repeated requests reuse the built PhotoImage"""
+        url = 'https://example.com/photo-cache.jpg'
+        with patch.object(self.image_service, '_load_image_from_cache', return_value=Mock()) as mock_load:
+            with patch('PIL.ImageTk.PhotoImage', return_value=Mock()):
+                first = self.image_service.get_image_from_cache_only(url)
+                second = self.image_service.download_and_cache_image(url)
+        
+        self.assertIs(first, second)
+        mock_load.assert_called_once()
+    
+    def test_decoded_image_cache(self):
+        """Test images are decoded once and reused"""
+        from PIL import Image
+        cache_dir = tempfile.mkdtemp()
+        try:
+            image_service = ImageService(cache_dir)
+            Image.new('RGB', (488, 680)).save(image_service._get_cache_filename(self.test_url), 'JPEG')
+            
+            with patch.object(image_service, '_load_image_from_cache',
+                              wraps=image_service._load_image_from_cache) as mock_load:
+                first = image_service._prepare_image(self.test_url, (100, 140), 10, download=False)
+                image = image_service._prepare_image(self.test_url, (100, 140), 10, download=False)
+            
+            self.assertIs(first, image)
+            mock_load.assert_called_once()
+            self.assertLessEqual(image.size[0], 100)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+    
     def test_get_image_from_cache_only(self):
         """Test get image only from cache"""
         # Test when image is not in cache
@@ -312,5 +561,164 @@ class TestImageService(unittest.TestCase):
                 self.assertTrue(result)
 
 
+class TestScryfallService(unittest.TestCase):
+    """Tests for ScryfallService"""
+    
+    def setUp(self):
+        """Initial setup for tests"""
+        self.scryfall_service = ScryfallService()
+    
+    def _response(self, data):
+        """Builds a successful mocked response"""
+        response = Mock(status_code=200, headers={}, content=json.dumps(data).encode())
+        response.json.return_value = data
+        return response
+    
+    def test_batch_get_card_by_name(self):
+        """Test several cards are fetched concurrently and keyed by name"""
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.side_effect = lambda url, params=None, **kwargs: self._response({'name': params['fuzzy']})
+            results = self.scryfall_service.batch_get_card_by_name(['Opt', 'Shock', 'Opt'])
+        
+        self.assertEqual(results, {'Opt': {'name': 'Opt'}, 'Shock': {'name': 'Shock'}})
+        self.assertEqual(mock_get.call_count, 2)
+    
+    def test_responses_are_cached(self):
+        """Test repeated lookups reuse the response and random cards skip the cache"""
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.return_value = self._response({'name': 'Opt'})
+            self.scryfall_service.get_card_by_name('Opt')
+            self.scryfall_service.get_card_by_name('Opt')
+            self.assertEqual(mock_get.call_count, 1)
+            
+            self.scryfall_service.get_random_card()
+            self.scryfall_service.get_random_card()
+            self.assertEqual(mock_get.call_count, 3)
+            
+            # Unknown names are remembered too
+            not_found = Mock(status_code=404)
+            not_found.raise_for_status.side_effect = requests.exceptions.HTTPError('404')
+            mock_get.return_value = not_found
+            self.assertFalse(self.scryfall_service.validate_card_name('Nonexistent'))
+            self.assertFalse(self.scryfall_service.validate_card_name('Nonexistent'))
+            self.assertEqual(mock_get.call_count, 4)
+    
+    def test_expired_response_is_revalidated(self):
+        """Test an expired response with an ETag is reused when Scryfall answers 304"""
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            response = self._response({'name': 'Opt'})
+            response.headers = {'ETag': '"v1"'}
+            mock_get.return_value = response
+            self.scryfall_service.get_card_by_name('Opt')
+            
+            # Expire every cached entry
+            expired_at = time.monotonic() - 1
+            for key, entry in list(self.scryfall_service._cache.items()):
+                self.scryfall_service._cache[key] = (expired_at, entry[1], entry[2])
+            
+            mock_get.return_value = Mock(status_code=304)
+            card_data = self.scryfall_service.get_card_by_name('Opt')
+        
+        self.assertEqual(card_data, {'name': 'Opt'})
+        self.assertEqual(mock_get.call_args[1]['headers'], {'If-None-Match': '"v1"'})
+        # The revalidated entry is fresh again
+        self.assertEqual(self.scryfall_service._get_cached(('cards/named', (('fuzzy', 'Opt'),))),
+                         (True, {'name': 'Opt'}))
+    
+    def test_stale_and_search_responses_are_not_kept(self):
+        """Test search pages skip the cache and old expired entries are dropped"""
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.return_value = self._response({'data': [], 'has_more': False})
+            self.scryfall_service.search_cards('cmc:1')
+            self.scryfall_service.search_cards('cmc:1')
+        
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(self.scryfall_service._cache), 0)
+        
+        # Past the revalidation window the ETag is no longer sent
+        key = ('cards/named', (('fuzzy', 'Opt'),))
+        self.scryfall_service._cache[key] = (time.monotonic() - 8 * 24 * 60 * 60, {'name': 'Opt'}, '"v1"')
+        self.assertIsNone(self.scryfall_service._get_stale(key))
+        self.assertEqual(self.scryfall_service._get_cached(key), (False, None))
+        self.assertNotIn(key, self.scryfall_service._cache)
+    
+    def test_card_accessors_share_one_fetch(self):
+        """Test image, legalities and validation of a card need a single request"""
+        card_data = {
+            'name': 'Opt',
+            'image_uris': {'small': 'small.jpg', 'normal': 'normal.jpg'},
+            'legalities': {'modern': 'legal'}
+        }
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.return_value = self._response(card_data)
+            self.assertEqual(self.scryfall_service.get_card_image_url('Opt', 'small'), 'small.jpg')
+            self.assertEqual(self.scryfall_service.get_card_legalities('Opt'), {'modern': 'legal'})
+            self.assertTrue(self.scryfall_service.validate_card_name('Opt'))
+        
+        mock_get.assert_called_once()
+    
+    def test_get_cards_bulk(self):
+        """Test names are fetched in chunks of 75 and matched back to the cards"""
+        names = [f'Card {i}' for i in range(80)] + ['Delver of Secrets']
+        
+        def post(url, json=None, **kwargs):
+            cards = [{'name': identifier['name']} for identifier in json['identifiers']
+                     if identifier['name'] not in ('Card 3', 'Delver of Secrets')]
+            if any(identifier['name'] == 'Delver of Secrets' for identifier in json['identifiers']):
+                cards.append({'name': 'Delver of Secrets // Insectile Aberration',
+                              'card_faces': [{'name': 'Delver of Secrets'}, {'name': 'Insectile Aberration'}]})
+            return self._response({'data': cards})
+        
+        with patch.object(self.scryfall_service.session, 'post', side_effect=post) as mock_post:
+            results = self.scryfall_service.get_cards_bulk(names)
+            self.assertEqual(mock_post.call_count, 2)
+            
+            self.assertEqual(results['Card 0'], {'name': 'Card 0'})
+            self.assertIsNone(results['Card 3'])
+            self.assertEqual(results['Delver of Secrets']['name'], 'Delver of Secrets // Insectile Aberration')
+            
+            # Later exact lookups are answered from the results
+            validity = self.scryfall_service.validate_card_names(['Card 0', 'Card 3'])
+            self.assertEqual(validity, {'Card 0': True, 'Card 3': False})
+            self.assertTrue(self.scryfall_service.validate_card_name('Card 79'))
+            self.assertEqual(mock_post.call_count, 2)
+    
+    def test_iter_search_walks_pages(self):
+        """Test search results are yielded across pages"""
+        pages = {
+            1: {'data': [{'name': 'Opt'}, {'name': 'Shock'}], 'has_more': True},
+            2: {'data': [{'name': 'Duress'}], 'has_more': False}
+        }
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.side_effect = lambda url, params=None, **kwargs: self._response(pages[params['page']])
+            names = [card['name'] for card in self.scryfall_service.iter_search('cmc:1')]
+        
+        self.assertEqual(names, ['Opt', 'Shock', 'Duress'])
+        self.assertEqual(mock_get.call_count, 2)
+        
+        # Pages are not kept in the response cache, and the walk stops at max_pages
+        with patch.object(self.scryfall_service.session, 'get') as mock_get:
+            mock_get.side_effect = lambda url, params=None, **kwargs: self._response(pages[params['page']])
+            names = [card['name'] for card in self.scryfall_service.iter_search('cmc:1', max_pages=1)]
+        
+        self.assertEqual(names, ['Opt', 'Shock'])
+        self.assertEqual(mock_get.call_count, 1)
+    
+    def test_get_service_is_shared(self):
+        """Test the module level accessor always returns the same instance"""
+        from src.services import scryfall_service
+        self.assertIs(scryfall_service.get_service(), scryfall_service.get_service())
+    
+    def test_rate_limit_allows_bursts(self):
+        """Test idle credit is spent without sleeping and an empty bucket waits"""
+        with patch('src.services.scryfall_service.time.sleep') as mock_sleep:
+            for _ in range(ScryfallService.RATE_LIMIT_BURST):
+                self.scryfall_service._rate_limit()
+            mock_sleep.assert_not_called()
+            
+            self.scryfall_service._rate_limit()
+            mock_sleep.assert_called_once()
+            self.assertLessEqual(mock_sleep.call_args[0][0], ScryfallService.RATE_LIMIT_DELAY)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file